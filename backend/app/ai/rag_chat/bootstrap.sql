@@ -0,0 +1,109 @@
+-- backend/app/ai/rag_chat/bootstrap.sql
+
+
+--  DB: indexes for the rag_chat_* tables
+--  (CONCURRENTLY can't run inside a transaction block; run with psql autocommit)
+
+
+
+
+
+-- 1) Conversation list
+-- list_conversations: WHERE team_id = … AND archived = … AND (last_activity_at, id) < (…)
+--   ORDER BY last_activity_at DESC, id DESC LIMIT n
+-- id is a key column so the keyset tie-breaker is part of the range read;
+-- INCLUDE makes the listing an index-only scan.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conv_team_activity_id
+  ON rag_chat_conversations (team_id, archived, last_activity_at DESC, id DESC)
+  INCLUDE (title, created_at, updated_at);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_conv_team_activity;
+
+
+
+
+
+-- 2) Runs + run updates
+-- "latest run for this conversation" is a single B-tree descent
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_runs_conv_id
+  ON rag_chat_runs (conversation_id, id DESC);
+
+-- get_run_updates: WHERE run_id = … AND seq > … ORDER BY seq is a contiguous range read
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_run_updates_run_seq
+  ON rag_chat_run_updates (run_id, seq);
+
+
+
+
+
+-- 3) Run-update notifications
+-- get_run_updates long-polls through one LISTEN rag_chat_run_upd connection per API process
+-- (payload = run id); NOTIFY is delivered on commit, identical ones within a commit collapse.
+-- Fired for every new run update and for every run status change (completed / failed),
+-- so a waiting poller returns as soon as its run ends.
+-- (The async read endpoints use the app's own credentials. Do NOT grant llm_reader SELECT on
+--  rag_chat_*: the model reads whatever llm_reader can, so that would expose every chat.)
+CREATE OR REPLACE FUNCTION rag_chat_notify_run_update() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('rag_chat_run_upd', NEW.run_id::text);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_rag_chat_run_updates_notify ON rag_chat_run_updates;
+CREATE TRIGGER trg_rag_chat_run_updates_notify
+  AFTER INSERT ON rag_chat_run_updates
+  FOR EACH ROW EXECUTE FUNCTION rag_chat_notify_run_update();
+
+CREATE OR REPLACE FUNCTION rag_chat_notify_run_status() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('rag_chat_run_upd', NEW.id::text);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_rag_chat_runs_status_notify ON rag_chat_runs;
+CREATE TRIGGER trg_rag_chat_runs_status_notify
+  AFTER UPDATE OF status ON rag_chat_runs
+  FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+  EXECUTE FUNCTION rag_chat_notify_run_status();
+
+
+
+
+
+-- 4) Cascading deletes
+-- delete_conversation issues a single DELETE on rag_chat_conversations;
+-- messages → runs → run updates follow through these FKs.
+ALTER TABLE rag_chat_messages
+  DROP CONSTRAINT IF EXISTS rag_chat_messages_conversation_id_fkey,
+  ADD  CONSTRAINT rag_chat_messages_conversation_id_fkey
+       FOREIGN KEY (conversation_id) REFERENCES rag_chat_conversations(id) ON DELETE CASCADE;
+
+ALTER TABLE rag_chat_runs
+  DROP CONSTRAINT IF EXISTS rag_chat_runs_conversation_id_fkey,
+  ADD  CONSTRAINT rag_chat_runs_conversation_id_fkey
+       FOREIGN KEY (conversation_id) REFERENCES rag_chat_conversations(id) ON DELETE CASCADE,
+  DROP CONSTRAINT IF EXISTS rag_chat_runs_user_message_id_fkey,
+  ADD  CONSTRAINT rag_chat_runs_user_message_id_fkey
+       FOREIGN KEY (user_message_id) REFERENCES rag_chat_messages(id) ON DELETE CASCADE;
+
+ALTER TABLE rag_chat_run_updates
+  DROP CONSTRAINT IF EXISTS rag_chat_run_updates_run_id_fkey,
+  ADD  CONSTRAINT rag_chat_run_updates_run_id_fkey
+       FOREIGN KEY (run_id) REFERENCES rag_chat_runs(id) ON DELETE CASCADE;
+
+
+
+
+
+-- 5) History window + rolling summary
+-- send_message reads ORDER BY created_at DESC, id DESC LIMIT n per conversation
+-- (get_conversation's ASC listing scans the same index backwards).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_conv_created
+  ON rag_chat_messages (conversation_id, created_at DESC, id DESC);
+
+-- Older turns are folded into summary; summary_through_id is the newest message it covers.
+ALTER TABLE rag_chat_conversations
+  ADD COLUMN IF NOT EXISTS summary            TEXT,
+  ADD COLUMN IF NOT EXISTS summary_through_id BIGINT;
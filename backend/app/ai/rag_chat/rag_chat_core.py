@@ -6,6 +6,7 @@ import json
 import requests
 from typing import List, Dict, Any, Optional, Callable
 from openai import OpenAI
+from openai.types.chat import ChatCompletionMessageToolCall
 
 # ─────────────────────────────────────────
 # OpenAI client + config
@@ -60,7 +61,8 @@ TOOLS = [
             "name": "run_sql",
             "description": (
                 "Execute a read-only SELECT query on the Postgres database "
-                "and return up to max_rows rows."
+                "and return up to max_rows rows as {columns: [...], rows: [[...], ...]} "
+                "(each row's values are in `columns` order)."
             ),
             "parameters": {
                 "type": "object",
@@ -856,6 +858,50 @@ def generate_conversation_title(history: List[Dict[str, str]]) -> Optional[str]:
     return title
 
 
+def summarize_history(
+    previous_summary: Optional[str],
+    messages: List[Dict[str, str]],
+) -> Optional[str]:
+    """
+    Fold `messages` (older turns that no longer fit in the history
+    window) into the running conversation summary.
+
+    Returns:
+        - the updated summary on success
+        - None if it could not be generated (keep the old one)
+    """
+    text_parts: List[str] = []
+    if previous_summary:
+        text_parts.append(f"Summary so far:\n{previous_summary}\n")
+    for msg in messages:
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+        text_parts.append(f"{role}: {content}")
+    text_blob = "\n".join(text_parts)
+
+    system_prompt = (
+        "You maintain a running summary of a talent-management analytics chat.\n"
+        "Update the summary with the new turns below. Keep names, IDs, filters,\n"
+        "numbers and open questions the user may refer back to.\n"
+        "Respond with ONLY the summary, at most ~200 words.\n"
+    )
+
+    try:
+        resp = client.chat.completions.create(
+            model=MODEL_ID,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text_blob},
+            ],
+        )
+        summary = (resp.choices[0].message.content or "").strip()
+    except Exception as e:
+        print(f"[rag_chat_core] summary model failed: {e!r}")
+        return None
+
+    return summary or None
+
+
 def build_messages(user_question: str) -> List[Dict[str, str]]:
     return [
         {
@@ -893,7 +939,8 @@ def _tool_run_sql(sql: str, max_rows: int = 200, on_update: Callable[[str, dict
     """
     Call the backend /llm/run_sql tool.
 
-    - On success: returns {"ok": True, "sql": ..., "rows": [...]}
+    - On success: returns {"ok": True, "sql": ..., "columns": [...], "rows": [[...], ...]}
+      (rows are positional, in `columns` order)
     - On failure: {"ok": False, ...}
 
     If on_update is provided, we log status updates into the DB via the router callback.
@@ -948,10 +995,12 @@ def _tool_run_sql(sql: str, max_rows: int = 200, on_update: Callable[[str, dict
             "detail": data,
         }
 
-    if isinstance(data, list):
-        row_count = len(data)
+    if isinstance(data, dict):
+        columns = data.get("columns") or []
+        rows = data.get("rows") or []
     else:
-        row_count = 1
+        columns, rows = [], data
+    row_count = len(rows) if isinstance(rows, list) else 1
 
     print(f"[tool_run_sql] <<< got {row_count} row(s) from /llm/run_sql")
 
@@ -961,7 +1010,8 @@ def _tool_run_sql(sql: str, max_rows: int = 200, on_update: Callable[[str, dict
     return {
         "ok": True,
         "sql": sql,
-        "rows": data,
+        "columns": columns,
+        "rows": rows,
     }
 
 
@@ -1299,9 +1349,64 @@ def answer_analytics_question(
 # Chat-style helper (full conversation history)
 # ─────────────────────────────────────────
 
+def _stream_completion(
+    messages: List[Dict[str, Any]],
+    on_token: Callable[[str], None],
+) -> Dict[str, Any]:
+    """
+    Streaming variant of a single tools-enabled chat.completions call.
+
+    Text deltas are forwarded to on_token as they arrive; tool_call deltas
+    are reassembled (they arrive split by index) so the result looks like
+    the non-streaming message: {"role", "content", "tool_calls"}.
+    """
+    stream = client.chat.completions.create(
+        model=MODEL_ID,
+        messages=messages,
+        tools=TOOLS,
+        tool_choice="auto",
+        stream=True,
+    )
+
+    content_parts: List[str] = []
+    calls: Dict[int, Dict[str, Any]] = {}
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+
+        if delta.content:
+            content_parts.append(delta.content)
+            on_token(delta.content)
+
+        for tc in delta.tool_calls or []:
+            slot = calls.setdefault(
+                tc.index,
+                {"id": None, "type": "function", "function": {"name": "", "arguments": ""}},
+            )
+            if tc.id:
+                slot["id"] = tc.id
+            if tc.function and tc.function.name:
+                slot["function"]["name"] += tc.function.name
+            if tc.function and tc.function.arguments:
+                slot["function"]["arguments"] += tc.function.arguments
+
+    tool_calls = [
+        ChatCompletionMessageToolCall.model_validate(calls[i]) for i in sorted(calls)
+    ]
+    return {
+        "role": "assistant",
+        "content": "".join(content_parts) or None,
+        "tool_calls": tool_calls or None,
+    }
+
+
+
 def call_llm_with_history(
     history: List[Dict[str, str]],
     on_update: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    summary: Optional[str] = None,
+    on_token: Optional[Callable[[str], None]] = None,
 ) -> str:
     """
     history: list of {"role": "user" | "assistant", "content": "..."}
@@ -1309,40 +1414,51 @@ def call_llm_with_history(
 
     If on_update is provided, status updates from tool calls
     (especially run_sql) are emitted through that callback.
+
+    If on_token is provided, every model call is streamed and text
+    deltas are passed to on_token as they arrive.
+
+    summary: optional running summary of turns older than `history`
+    (see summarize_history); sent as a second system message.
     """
     messages: List[Dict[str, Any]] = [{"role": "system", "content": SYSTEM_PROMPT}]
+    if summary:
+        messages.append(
+            {
+                "role": "system",
+                "content": f"Summary of the earlier conversation:\n{summary}",
+            }
+        )
     messages.extend(history)
 
     # Optional: let the router send "Analyzing question…" before calling us.
     # We don't add any "Summarizing…" messages here.
 
     while True:
-        resp = client.chat.completions.create(
-            model=MODEL_ID,
-            messages=messages,
-            tools=TOOLS,
-            tool_choice="auto",
-        )
-        msg = resp.choices[0].message
+        if on_token:
+            msg = _stream_completion(messages, on_token)
+        else:
+            resp = client.chat.completions.create(
+                model=MODEL_ID,
+                messages=messages,
+                tools=TOOLS,
+                tool_choice="auto",
+            )
+            m = resp.choices[0].message
+            msg = {"role": m.role, "content": m.content, "tool_calls": m.tool_calls}
 
         # Append an assistant message (including the tool_calls) into the history
-        messages.append(
-            {
-                "role": msg.role,
-                "content": msg.content,
-                "tool_calls": msg.tool_calls,
-            }
-        )
+        messages.append(msg)
 
         # If the model wants to call tools, execute them, then loop again
-        if msg.tool_calls:
-            for tc in msg.tool_calls:
+        if msg["tool_calls"]:
+            for tc in msg["tool_calls"]:
                 tool_msg = _execute_tool_call(tc, on_update=on_update)
                 messages.append(tool_msg)
             continue
 
         # No tool calls → final answer
-        return msg.content or ""
+        return msg["content"] or ""
 
 
 
@@ -2,6 +2,7 @@
 
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -14,10 +15,20 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set in the environment")
 
+# psycopg (v3) only: server-side prepare any statement run this many times
+# on a connection, so hot module-level text() statements skip parse/plan.
+# Set DB_PREPARE_THRESHOLD= (empty) to disable, e.g. behind a transaction-mode
+# pooler. psycopg2 has no equivalent and ignores this.
+connect_args = {}
+if make_url(DATABASE_URL).get_driver_name() == "psycopg":
+    _threshold = os.getenv("DB_PREPARE_THRESHOLD", "1")
+    connect_args["prepare_threshold"] = int(_threshold) if _threshold else None
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
+    connect_args=connect_args,
 )
 
 # SessionLocal class for database sessions
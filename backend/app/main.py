@@ -1,8 +1,12 @@
 # backend/app/main.py
 
 import os
+import logging
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from .database import get_db
@@ -37,7 +41,20 @@ from .ai.recommend_client_for_project_need.router import (
 
 DEMO_MODE = os.getenv("DEMO_MODE", "false").lower() == "true"
 
-app = FastAPI(title="Manager Portal API")
+# INFO in production; LOG_LEVEL=DEBUG shows e.g. the SQL run by /llm/run_sql
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync (`def`) routes run on anyio's worker threads, 40 by default;
+    # most routers still use the sync SQLAlchemy Session, so widen it.
+    to_thread.current_default_thread_limiter().total_tokens = int(
+        os.getenv("THREADPOOL_SIZE", "100")
+    )
+    yield
+
+
+app = FastAPI(title="Manager Portal API", lifespan=lifespan)
 
 # ---- CORS configuration ----
 _frontend = os.getenv("FRONTEND_URL")
@@ -66,6 +83,10 @@ else:
         allow_headers=["*"],
     )
 
+# ---- Compression ----
+# gzip anything over 1 KB (e.g. /llm/run_sql rows, big list endpoints)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Paths that any user may POST to without manager/admin guard
 PUBLIC_WRITE_PATHS = {
     "/auth/invite",
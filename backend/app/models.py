@@ -445,6 +445,8 @@ class Sub(Base):
     feedback          = relationship("SubFeedback", cascade="all, delete-orphan", order_by="SubFeedback.created_at.desc()")
     mandates          = relationship("Mandate", secondary="sub_to_mandate", lazy="joined")
     creator           = relationship("Manager", lazy="joined", foreign_keys=[created_by])
+    # read-only: sub_recipients + person/company names (sub_recipient_enriched view)
+    recipients_enriched = relationship("SubRecipientEnriched", viewonly=True)
 
 
 
@@ -457,6 +459,17 @@ class SubRecipient(Base):
     recipient_company = Column(String, nullable=True)       # NW_…, ST_…, PC_… or NULL
 
 
+class SubRecipientEnriched(Base):
+    """Read-only mapping of the `sub_recipient_enriched` view."""
+    __tablename__ = "sub_recipient_enriched"
+    sub_id         = Column(String, ForeignKey("subs.id"), primary_key=True)
+    recipient_type = Column(String,     primary_key=True)
+    recipient_id   = Column(String,     primary_key=True)
+    recipient_company = Column(String, nullable=True)
+    person_name    = Column(String)
+    company_name   = Column(String)
+
+
 # ─── Feedback rows -----------------------------------------------------------
 class SubFeedback(Base):
     __tablename__ = "sub_feedback"
@@ -1,7 +1,7 @@
 # backend/app/routers/creatives.py
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, cast, Integer, func, select, desc
+from sqlalchemy import and_, bindparam, cast, Integer, func, select, desc
 from sqlalchemy.orm import Session, joinedload, aliased, with_loader_criteria
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql import text
@@ -18,29 +18,29 @@ router = APIRouter(prefix="/creatives", tags=["Creatives"])
 
 
 # helpers
+# Name lookups are built once; each call only binds the ids.
+_NAMES_BY_PREFIX = {
+    prefix: select(model.id, model.name).where(model.id.in_(bindparam("ids", expanding=True)))
+    for prefix, model in (("CR", models.Creative), ("TM", models.Manager))   # `team`
+}
 
-def resolve_user_name(db: Session, user_id: str | None) -> str | None:
+
+def resolve_user_names(db: Session, user_ids) -> dict[str, str]:
     """
-    Translate a TM_ / CR_ ID into the person’s name.
-    Returns None for null / unknown / unsupported prefixes.
+    Translate TM_ / CR_ IDs into people’s names, as {id: name}.
+    One IN query per prefix however many (repeated) ids come in; null /
+    unknown / unsupported ids are simply absent from the result.
     """
-    if not user_id:
-        return None
-
-    prefix = user_id[:2]
-    if prefix == "CR":
-        return (
-            db.query(models.Creative.name)
-              .filter(models.Creative.id == user_id)
-              .scalar()
-        )
-    if prefix == "TM":
-        return (
-            db.query(models.Manager.name)           # table name is `team`
-              .filter(models.Manager.id == user_id)
-              .scalar()
-        )
-    return None
+    by_prefix: dict[str, set[str]] = {"CR": set(), "TM": set()}
+    for user_id in user_ids:
+        if user_id and user_id[:2] in by_prefix:
+            by_prefix[user_id[:2]].add(user_id)
+
+    names: dict[str, str] = {}
+    for prefix, stmt in _NAMES_BY_PREFIX.items():
+        if by_prefix[prefix]:
+            names.update(db.execute(stmt, {"ids": list(by_prefix[prefix])}).tuples())
+    return names
 
 def list_writing_samples_for_creative(db: Session, creative_id: str
 ) -> list[schemas.WritingSampleListRow]:
@@ -86,8 +86,11 @@ def list_writing_samples_for_creative(db: Session, creative_id: str
         .order_by(P.title, WS.filename)
     )
 
+    results = q.all()
+    names = resolve_user_names(db, (ws.uploaded_by for ws, *_ in results))
+
     rows = []
-    for ws, project_title, sub_count, file_desc in q.all():
+    for ws, project_title, sub_count, file_desc in results:
         rows.append(
             schemas.WritingSampleListRow(
                 id=ws.id,
@@ -99,7 +102,7 @@ def list_writing_samples_for_creative(db: Session, creative_id: str
                 project_title=project_title,
                 sub_count=sub_count,
                 uploaded_by=ws.uploaded_by,
-                uploaded_by_name=resolve_user_name(db, ws.uploaded_by),
+                uploaded_by_name=names.get(ws.uploaded_by),
             )
         )
     return rows
@@ -194,16 +194,7 @@ def list_executives_flat(
 
     rows = db.execute(page_q).all()
 
-    items = [
-        schemas.ExecutiveListRow(
-            executive_id   = r.executive_id,
-            executive_name = r.executive_name,
-            company_id     = r.company_id,
-            company_name   = r.company_name,
-            company_type   = r.company_type,
-        )
-        for r in rows
-    ]
+    items = [schemas.ExecutiveListRow.from_orm_trusted(r) for r in rows]
     return {"total": total, "items": items}
 
 
@@ -291,16 +282,8 @@ def list_executives_agg(
         agg.order_by(b.c.executive_name.asc()).limit(limit).offset(offset)
     ).all()
 
-    items = [
-        schemas.ExecutiveAggListRow(
-            executive_id=r.executive_id,
-            executive_name=r.executive_name,
-            company_ids=r.company_ids or [],
-            company_names=r.company_names or [],
-            company_types=r.company_types or [],
-        )
-        for r in rows
-    ]
+    # array_remove() hands back '{}' (never NULL) for an exec with no companies
+    items = [schemas.ExecutiveAggListRow.from_orm_trusted(r) for r in rows]
     return {"total": total, "items": items}
 
 
@@ -601,7 +584,7 @@ def list_exec_subs_feedback(
     client_rows = db.execute(clients_q).all()
     clients_map: dict[str, list[schemas.CreativeMini]] = {}
     for r in client_rows:
-        clients_map.setdefault(r.sub_id, []).append(schemas.CreativeMini(id=r.id, name=r.name))
+        clients_map.setdefault(r.sub_id, []).append(schemas.CreativeMini.from_orm_trusted(r))
 
     # total
     count_q = select(func.count()).select_from(
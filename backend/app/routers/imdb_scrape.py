@@ -423,13 +423,17 @@ def sync_creative_credits(
     *,
     sleep: float = 0.3,
     progress: Optional[Callable[[dict], None]] = None,  # ← FIXED
+    commit_every: int = 1,
 ) -> Dict[str, Any]:
     """
     Scrape all credits for one creative (by nm id) and persist:
       - projects (insert/update)
       - creative_project_roles (idempotent)
       - genre tags (idempotent)
-    Returns a summary dict. Raises on fatal errors. Commits per title.
+    Returns a summary dict. Raises on fatal errors. Commits every
+    `commit_every` titles (and at the end); each title runs in a SAVEPOINT
+    so a failed one only undoes itself. A failed commit raises, leaving
+    the rollback to the caller.
     """
     name_url = f"https://www.imdb.com/name/{imdb_id}/"
 
@@ -442,6 +446,7 @@ def sync_creative_credits(
     if progress: progress({"type": "plan", "total": total, "role_counts": dict(role_counts)})
 
     ok = err = 0
+    pending = 0
     start = time.monotonic()
 
     for i, (tt, url, role) in enumerate(credits, start=1):
@@ -451,16 +456,16 @@ def sync_creative_credits(
             meta = _title_meta(url)
             title_for_log = meta.get("title") or tt
 
-            pid, is_new = _upsert_project(db, tt, meta)
-            _link_role(db, creative_id, pid, role)
-            if is_new and meta.get("tags"):
-                _upsert_tags_and_link(db, pid, meta["tags"])
+            with db.begin_nested():
+                pid, is_new = _upsert_project(db, tt, meta)
+                _link_role(db, creative_id, pid, role)
+                if is_new and meta.get("tags"):
+                    _upsert_tags_and_link(db, pid, meta["tags"])
 
-            db.commit()
+            pending += 1
             ok += 1
             status = "NEW" if is_new else "OK"
         except Exception as e:
-            db.rollback()
             err += 1
             status = "ERR"
             if progress:
@@ -469,6 +474,13 @@ def sync_creative_credits(
                     "message": f"⚠ {tt} ({role}) — {type(e).__name__}: {e}",
                 })
 
+        # Outside the per-title try: a failed commit loses the whole batch,
+        # so it ends the sync (the caller rolls back / retries the creative)
+        # instead of being booked against this one title.
+        if pending >= commit_every:
+            db.commit()
+            pending = 0
+
         if progress:
             elapsed_ms = int((time.monotonic() - start) * 1000)
             progress({
@@ -479,6 +491,9 @@ def sync_creative_credits(
 
         time.sleep(sleep)
 
+    if pending:
+        db.commit()
+
     summary = {
         "type": "done",
         "total": total,
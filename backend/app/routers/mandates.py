@@ -35,7 +35,8 @@ def list_mandates(
     total = qy.count()
     rows = (qy.order_by(models.Mandate.updated_at.desc())
               .limit(limit).offset(offset).all())
-    return {"total": total, "items": rows}
+    return {"total": total,
+            "items": [schemas.MandateListItem.from_orm_trusted(r) for r in rows]}
 
 
 @router.get("/{mandate_id}", response_model=schemas.MandateDetail, dependencies=[Depends(require_team_or_higher)])
@@ -129,7 +130,7 @@ def list_subs_for_mandate(
         .where(models.sub_to_client.c.sub_id.in_(sub_ids))
     ).all():
         clients_map.setdefault(sub_id, []).append(
-            schemas.CreativeMini.model_validate(creative)
+            schemas.CreativeMini.from_orm_trusted(creative)
         )
 
     # 5) Recipients via SubRecipient ORM (NOT a Table)
@@ -172,21 +173,21 @@ def list_subs_for_mandate(
     for sub_id, rid in rec_rows:
         if rid.startswith("EX_"):
             recipients_map[sub_id].append(
-                schemas.RecipientMini(
+                schemas.RecipientMini.model_construct(
                     id=rid, type="executive", name=exec_name.get(rid, "Executive"),
                     company_id=None, company_name=None
                 )
             )
         elif rid.startswith("XR_"):
             recipients_map[sub_id].append(
-                schemas.RecipientMini(
+                schemas.RecipientMini.model_construct(
                     id=rid, type="external_rep", name=xr_name.get(rid, "External Rep"),
                     company_id=None, company_name=None
                 )
             )
         elif rid.startswith("CR_"):
             recipients_map[sub_id].append(
-                schemas.RecipientMini(
+                schemas.RecipientMini.model_construct(
                     id=rid, type="creative", name=cr_name.get(rid, "Creative"),
                     company_id=None, company_name=None
                 )
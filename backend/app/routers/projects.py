@@ -1,7 +1,7 @@
 # backend/app/routers/projects.py
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from sqlalchemy import select, insert, text, exists, literal_column, func, case, literal, cast, String
+from sqlalchemy import select, insert, text, exists, literal_column, func, case, literal, cast, String, bindparam
 from sqlalchemy.orm import Session, joinedload, load_only
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional, Tuple, Dict
@@ -17,26 +17,49 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 
 # helpers
 
-def _company_model_for(company_id: str):
-    if company_id.startswith("NW_"): return models.TVNetwork
-    if company_id.startswith("ST_"): return models.Studio
-    if company_id.startswith("PC_"): return models.ProductionCompany
-    return None
-
-def _project_company_link_for(company_id: str):
+def _company_link_spec(Model, Link, fk_name: str) -> dict:
     """
-    Return (LinkTable, fk_col, fk_name) for a given company id.
+    Everything add/remove needs for one company prefix, with the
+    statements built once at import time. Bind :pid / :cid per request.
     """
-    if company_id.startswith("NW_"):
-        t = models.project_to_tv_networks
-        return t, t.c.network_id, "network_id"
-    if company_id.startswith("ST_"):
-        t = models.project_to_studios
-        return t, t.c.studio_id, "studio_id"
-    if company_id.startswith("PC_"):
-        t = models.project_to_production_companies
-        return t, t.c.production_company_id, "production_company_id"
-    return None, None, None
+    fk_col = Link.c[fk_name]
+    extra = {"last_modified": text("now()")} if "last_modified" in Link.c else {}
+    soft = "status" in Link.c
+
+    upsert = (
+        pg_insert(Link)
+        .values(
+            project_id=bindparam("pid"),
+            **{fk_name: bindparam("cid")},
+            **({"status": "Active"} if soft else {}),
+        )
+        .on_conflict_do_update(
+            index_elements=["project_id", fk_name],
+            set_={**({"status": "Active"} if soft else {}), **extra},
+        )
+    )
+    match = (Link.c.project_id == bindparam("pid")) & (fk_col == bindparam("cid"))
+    if soft:
+        remove = Link.update().where(match).values(status="Archived", **extra)
+    else:
+        remove = Link.delete().where(match)
+
+    return {"model": Model, "upsert": upsert, "remove": remove}
+
+
+# company id prefix → link spec
+_COMPANY_LINKS = {
+    "NW_": _company_link_spec(models.TVNetwork, models.project_to_tv_networks, "network_id"),
+    "ST_": _company_link_spec(models.Studio, models.project_to_studios, "studio_id"),
+    "PC_": _company_link_spec(
+        models.ProductionCompany, models.project_to_production_companies, "production_company_id"
+    ),
+}
+
+
+def _company_spec_for(company_id: str) -> Optional[dict]:
+    return _COMPANY_LINKS.get(company_id[:3])
+
 
 def _get_notes_for(db: Session, noteable_type: str, noteable_id: str):
     return (
@@ -874,30 +897,11 @@ def add_company_to_project(project_id: str, company_id: str, db: Session = Depen
     if db.get(models.Project, project_id) is None:
         raise HTTPException(404, "Project not found")
 
-    CompanyModel = _company_model_for(company_id)
-    if CompanyModel is None or db.get(CompanyModel, company_id) is None:
+    spec = _company_spec_for(company_id)
+    if spec is None or db.get(spec["model"], company_id) is None:
         raise HTTPException(404, "Company not found or unsupported prefix")
 
-    Link, fk_col, fk_name = _project_company_link_for(company_id)
-    if Link is None or fk_col is None or fk_name is None:
-        raise HTTPException(400, "Unsupported company id prefix")
-
-    vals = {"project_id": project_id, fk_name: company_id}
-    if "status" in Link.c:
-        vals["status"] = "Active"
-
-    stmt = (
-        pg_insert(Link)
-        .values(**vals)
-        .on_conflict_do_update(
-            index_elements=["project_id", fk_name],
-            set_={
-                **({"status": "Active"} if "status" in Link.c else {}),
-                **({"last_modified": text("now()")} if "last_modified" in Link.c else {}),
-            }
-        )
-    )
-    db.execute(stmt)
+    db.execute(spec["upsert"], {"pid": project_id, "cid": company_id})
     db.commit()
 
 # ────────────────────────── REMOVE a company from project ──────────────────────
@@ -911,24 +915,10 @@ def remove_company_from_project(project_id: str, company_id: str, db: Session =
     if db.get(models.Project, project_id) is None:
         raise HTTPException(404, "Project not found")
 
-    Link, fk_col, fk_name = _project_company_link_for(company_id)
-    if Link is None or fk_col is None or fk_name is None:
+    spec = _company_spec_for(company_id)
+    if spec is None:
         raise HTTPException(400, "Unsupported company id prefix")
 
-    if "status" in Link.c:
-        db.execute(
-            Link.update()
-                .where(Link.c.project_id == project_id)
-                .where(fk_col == company_id)
-                .values(
-                    status="Archived",
-                    **({"last_modified": text("now()")} if "last_modified" in Link.c else {})
-                )
-        )
-    else:
-        db.execute(
-            Link.delete()
-                .where(Link.c.project_id == project_id)
-                .where(fk_col == company_id)
-        )
+    # soft-archive where the link table has a status column, else delete
+    db.execute(spec["remove"], {"pid": project_id, "cid": company_id})
     db.commit()
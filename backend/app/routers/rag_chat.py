@@ -1,18 +1,26 @@
 # backend/app/routers/rag_chat.py
 
 import os
+import asyncio
+import logging
+import queue
+import threading
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Literal, AsyncIterator
+from decimal import Decimal
+from typing import List, Dict, Any, Optional, Literal, AsyncIterator, Callable, Iterator
 
 import re
-import json
 import asyncpg
-from fastapi import APIRouter, Depends, HTTPException, Response
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import text
+from sqlalchemy import Integer, bindparam, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import DATABASE_URL, SessionLocal, get_db
 
 # Re-use your existing RAG chat plumbing
 from ..ai.rag_chat import rag_chat_core as rag_core
@@ -61,12 +69,20 @@ from ..ai.rag_chat import rag_chat_core as rag_core
 # Single router that handles BOTH llm-tools and rag-chat
 router = APIRouter(tags=["llm-tools", "rag-chat"])
 
+logger = logging.getLogger(__name__)
+
 # ─────────────────────────────────────────
 # Demo-mode: single hard-coded team_id
 # ─────────────────────────────────────────
 
 DEMO_TEAM_ID = os.getenv("DEMO_TEAM_ID", "DEMO_TEAM")
 
+# How many recent messages are sent to the LLM verbatim; anything older
+# is folded into rag_chat_conversations.summary once at least
+# RAG_CHAT_SUMMARY_EVERY messages have dropped out of the window.
+HISTORY_LIMIT = int(os.getenv("RAG_CHAT_HISTORY_LIMIT", "40"))
+SUMMARY_EVERY = int(os.getenv("RAG_CHAT_SUMMARY_EVERY", "10"))
+
 
 # ─────────────────────────────────────────
 # asyncpg dependency for llm_reader
@@ -77,17 +93,190 @@ LLM_DB_DSN = os.getenv("LLM_DB_DSN")
 if not LLM_DB_DSN:
     raise RuntimeError("LLM_DB_DSN environment variable is not set")
 
+_LIST_TABLES_SQL = """
+    SELECT table_name
+    FROM information_schema.tables
+    WHERE table_schema = 'public'
+      AND table_type = 'BASE TABLE'
+    ORDER BY table_name;
+"""
+
+_GET_SCHEMA_SQL = """
+    SELECT
+      column_name,
+      data_type,
+      is_nullable
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+      AND table_name = $1
+    ORDER BY ordinal_position;
+"""
+
+
+# Read-only rag_chat listings served from the app pool (not llm_reader)
+_LIST_CONV_SQL = """
+    SELECT id, team_id, title, created_at, updated_at, last_activity_at, archived
+    FROM rag_chat_conversations
+    WHERE team_id = $1
+      AND ($2::boolean OR archived = FALSE)
+      AND ($3::timestamptz IS NULL
+           OR (last_activity_at, id) < ($3::timestamptz, COALESCE($4::bigint, 0)))
+    ORDER BY last_activity_at DESC, id DESC
+    LIMIT $5
+"""
+
+_GET_CONV_SQL = """
+    SELECT id, team_id, title, created_at, updated_at, last_activity_at, archived
+    FROM rag_chat_conversations
+    WHERE id = $1
+      AND team_id = $2
+"""
+
+_LIST_MESSAGES_SQL = """
+    SELECT id, conversation_id, role, content, meta, created_at
+    FROM rag_chat_messages
+    WHERE conversation_id = $1
+    ORDER BY created_at ASC, id ASC
+"""
+
+# run_updates long-poll reads
+# Latest run for a conversation; no row at all means the conversation
+# doesn't exist for the demo team
+_LATEST_RUN_SQL = """
+    SELECT r.id, r.status
+    FROM rag_chat_conversations c
+    LEFT JOIN LATERAL (
+        SELECT id, status
+        FROM rag_chat_runs
+        WHERE conversation_id = c.id
+        ORDER BY id DESC
+        LIMIT 1
+    ) r ON TRUE
+    WHERE c.id = $1
+      AND c.team_id = $2
+"""
+
+_RUN_STATUS_SQL = """
+    SELECT status FROM rag_chat_runs WHERE id = $1
+"""
+
+_LIST_RUN_UPDATES_SQL = """
+    SELECT id, run_id, seq, kind, content, created_at
+    FROM rag_chat_run_updates
+    WHERE run_id = $1
+      AND ($2::int IS NULL OR seq > $2::int)
+    ORDER BY seq ASC
+"""
+
+
+class _LLMConnection(asyncpg.Connection):
+    """
+    asyncpg connection that carries the prepared information_schema
+    statements used by the /llm tool endpoints.
+    """
+    __slots__ = ("_stmt_list_tables", "_stmt_get_schema")
+
+
+async def _init_jsonb(conn: asyncpg.Connection) -> None:
+    """
+    jsonb travels in Postgres' binary format (a version byte followed by
+    the JSON text) and is (de)serialized with orjson, so rows come back
+    as dicts without a text decode + json.loads per value.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        schema="pg_catalog",
+        encoder=lambda v: b"\x01" + orjson.dumps(v),
+        decoder=lambda b: orjson.loads(b[1:]),
+        format="binary",
+    )
+
+
+async def _init_llm_conn(conn: _LLMConnection) -> None:
+    """
+    Pool `init` hook: runs once per physical connection, so the
+    information_schema queries are parsed + planned only once.
+    """
+    await _init_jsonb(conn)
+    conn._stmt_list_tables = await conn.prepare(_LIST_TABLES_SQL)
+    conn._stmt_get_schema = await conn.prepare(_GET_SCHEMA_SQL)
+
+
+_llm_pool: Optional[asyncpg.Pool] = None
+_llm_pool_lock = asyncio.Lock()
+
+
+async def _get_llm_pool() -> asyncpg.Pool:
+    """
+    Lazily create the shared llm_reader pool on first use.
+    """
+    global _llm_pool
+    if _llm_pool is None:
+        async with _llm_pool_lock:
+            if _llm_pool is None:
+                _llm_pool = await asyncpg.create_pool(
+                    LLM_DB_DSN,
+                    min_size=1,
+                    max_size=int(os.getenv("LLM_DB_POOL_SIZE", "10")),
+                    connection_class=_LLMConnection,
+                    init=_init_llm_conn,
+                )
+    return _llm_pool
+
 
 async def get_llm_conn() -> AsyncIterator[asyncpg.Connection]:
     """
-    FastAPI dependency: yields a read-only connection as llm_reader.
-    Automatically closes after the request.
+    FastAPI dependency: yields a read-only pooled connection as llm_reader.
+    The connection goes back to the pool after the request.
     """
-    conn = await asyncpg.connect(LLM_DB_DSN)
-    try:
+    pool = await _get_llm_pool()
+    async with pool.acquire() as conn:
+        yield conn
+
+
+# ─────────────────────────────────────────
+# asyncpg dependency for the rag_chat_* reads
+# ─────────────────────────────────────────
+# Chat history is read with the app's own credentials, never as
+# llm_reader: whatever llm_reader can SELECT, the model can read through
+# run_sql. A separate pool also keeps these reads from queueing behind
+# (or starving) the tool calls of a running turn.
+
+APP_DB_DSN = os.getenv("APP_DB_DSN") or (
+    make_url(DATABASE_URL)
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False)
+)
+
+_app_pool: Optional[asyncpg.Pool] = None
+_app_pool_lock = asyncio.Lock()
+
+
+async def _get_app_pool() -> asyncpg.Pool:
+    """
+    Lazily create the rag_chat read pool on first use.
+    """
+    global _app_pool
+    if _app_pool is None:
+        async with _app_pool_lock:
+            if _app_pool is None:
+                _app_pool = await asyncpg.create_pool(
+                    APP_DB_DSN,
+                    min_size=1,
+                    max_size=int(os.getenv("APP_DB_POOL_SIZE", "10")),
+                    init=_init_jsonb,
+                )
+    return _app_pool
+
+
+async def get_app_conn() -> AsyncIterator[asyncpg.Connection]:
+    """
+    FastAPI dependency: yields a pooled connection on the app credentials
+    for the async rag_chat routes.
+    """
+    pool = await _get_app_pool()
+    async with pool.acquire() as conn:
         yield conn
-    finally:
-        await conn.close()
 
 
 # ─────────────────────────────────────────
@@ -101,15 +290,7 @@ async def list_tables(
     """
     Return the list of tables the llm_reader can see in the public schema.
     """
-    rows = await conn.fetch(
-        """
-        SELECT table_name
-        FROM information_schema.tables
-        WHERE table_schema = 'public'
-          AND table_type = 'BASE TABLE'
-        ORDER BY table_name;
-        """
-    )
+    rows = await conn._stmt_list_tables.fetch()
     return [r["table_name"] for r in rows]
 
 
@@ -121,19 +302,7 @@ async def get_schema(
     """
     Return column name, data type, and nullability for a given table in public schema.
     """
-    rows = await conn.fetch(
-        """
-        SELECT
-          column_name,
-          data_type,
-          is_nullable
-        FROM information_schema.columns
-        WHERE table_schema = 'public'
-          AND table_name = $1
-        ORDER BY ordinal_position;
-        """,
-        table_name,
-    )
+    rows = await conn._stmt_get_schema.fetch(table_name)
     if not rows:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     return [
@@ -146,23 +315,54 @@ async def get_schema(
     ]
 
 
+# Compiled once; each is a single case-insensitive scan over the SQL text.
+_LIMIT_RE = re.compile(r"\blimit\b", re.I)
+_FORBIDDEN_RE = re.compile(r"\b(insert|update|delete|drop|alter|truncate)\b", re.I)
+
+
 class RunSQLRequest(BaseModel):
     sql: str
     max_rows: int = 200
 
 
-@router.post("/llm/run_sql")
+def _rows_json_default(value: Any) -> Any:
+    # Types orjson doesn't encode natively (numeric, interval, ranges, ...)
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+class RowsJSONResponse(Response):
+    """
+    orjson-encoded rows straight from asyncpg Records; datetimes / UUIDs
+    are native, NUMERIC becomes a float (as jsonable_encoder did).
+    (A plain Response subclass: ORJSONResponse is deprecated in FastAPI
+    and warns on every instantiation.)
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_rows_json_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+@router.post("/llm/run_sql", response_class=RowsJSONResponse)
 async def run_sql(
     body: RunSQLRequest,
     conn: asyncpg.Connection = Depends(get_llm_conn),
-) -> List[Dict[str, Any]]:
+) -> RowsJSONResponse:
     """
-    Execute a read-only SELECT query (on public.*) and return up to max_rows rows.
+    Execute a read-only SELECT query (on public.*) and return up to max_rows rows,
+    column-oriented: {"columns": [name, ...], "rows": [[value, ...], ...]}.
 
     This is the main tool the LLM will use to actually read data.
 
     For debugging / prompt-tuning:
-    - Logs the final SQL it runs (after adding LIMIT).
+    - Logs the final SQL it runs (after adding LIMIT) at DEBUG.
     - On failure, includes the SQL in the error payload so the caller
       can see *exactly* what was attempted.
     """
@@ -174,30 +374,26 @@ async def run_sql(
         lines.pop(0)
     sql_no_comments = "\n".join(lines).lstrip()
 
-    lower_no_comments = sql_no_comments.lower()
-
     # Very simple safety checks; llm_reader is read-only, but lets keep queries sane.
-    if not lower_no_comments.startswith("select"):
+    if sql_no_comments[:6].lower() != "select":
         detail = {
             "error": "Only SELECT queries are allowed",
             "sql": raw_sql,
         }
-        print("[llm.run_sql] REJECT non-SELECT:", detail)
+        logger.warning("run_sql rejected non-SELECT: %s", raw_sql)
         raise HTTPException(status_code=400, detail=detail)
 
-    forbidden_keywords = ["insert ", "update ", "delete ", "drop ", "alter ", "truncate "]
-    lower_full = raw_sql.lower()
-    if any(k in lower_full for k in forbidden_keywords):
+    if _FORBIDDEN_RE.search(raw_sql):
         detail = {
             "error": "Only read-only SELECT queries are allowed",
             "sql": raw_sql,
         }
-        print("[llm.run_sql] REJECT forbidden keyword:", detail)
+        logger.warning("run_sql rejected forbidden keyword: %s", raw_sql)
         raise HTTPException(status_code=400, detail=detail)
 
     # Detect an existing LIMIT anywhere after comments (case-insensitive).
     # This fixes the "LIMIT 5 LIMIT 200" bug.
-    has_limit = bool(re.search(r"\blimit\b", lower_no_comments))
+    has_limit = _LIMIT_RE.search(sql_no_comments) is not None
 
     # Auto-add LIMIT only if the query doesn't already have one
     final_sql = raw_sql
@@ -205,22 +401,30 @@ async def run_sql(
         final_sql = f"{raw_sql} LIMIT {body.max_rows}"
 
     # Log the final SQL the LLM actually caused to be executed
-    print("\n[llm.run_sql] >>> executing SQL:")
-    print(final_sql)
+    logger.debug("run_sql executing SQL:\n%s", final_sql)
 
     try:
-        rows = await conn.fetch(final_sql)
+        stmt = await conn.prepare(final_sql)
+        rows = await stmt.fetch()
     except Exception as e:
         # Surface the SQL and the DB error to the caller
         detail = {
             "error": f"SQL error: {e}",
             "sql": final_sql,
         }
-        print("[llm.run_sql] !!! ERROR:", detail)
+        logger.warning("run_sql error: %s\n%s", e, final_sql)
         raise HTTPException(status_code=400, detail=detail)
 
-    print(f"[llm.run_sql] <<< returned {len(rows)} row(s)")
-    return [dict(r) for r in rows]
+    logger.debug("run_sql returned %d row(s)", len(rows))
+    # Column names come from the statement once (also for zero rows);
+    # rows stay positional tuples instead of one dict per Record.
+    # Returned as a Response so FastAPI skips its jsonable_encoder pass
+    return RowsJSONResponse(
+        {
+            "columns": [a.name for a in stmt.get_attributes()],
+            "rows": [tuple(r) for r in rows],
+        }
+    )
 
 
 # ─────────────────────────────────────────
@@ -269,6 +473,157 @@ class SendMessageResponse(BaseModel):
     messages: List[ChatMessage]
 
 
+# ─────────────────────────────────────────
+# RAG chat SQL
+# Built once at import so SQLAlchemy's compiled cache hits from the
+# first request instead of re-parsing a fresh text() every call.
+# ─────────────────────────────────────────
+
+_Q_GET_CONV = text(
+    """
+    SELECT id, team_id, title, created_at, updated_at, last_activity_at, archived
+    FROM rag_chat_conversations
+    WHERE id = :cid
+      AND team_id = :team_id
+    """
+)
+
+_Q_INSERT_RUN_UPDATES = text(
+    """
+    INSERT INTO rag_chat_run_updates (run_id, seq, kind, content)
+    SELECT :run_id, x.seq, x.kind, x.content
+    FROM jsonb_to_recordset(CAST(:batch AS JSONB))
+         AS x(seq int, kind text, content jsonb)
+    """
+)
+
+_Q_CREATE_CONV = text(
+    """
+    INSERT INTO rag_chat_conversations (team_id, title)
+    VALUES (:team_id, :title)
+    RETURNING id, team_id, title, created_at, updated_at, last_activity_at, archived
+    """
+)
+
+# Newest-first window (reversed in Python) + the conversation's title and
+# summary. One row per message; a single all-NULL message row if there
+# are none; no rows if the conversation isn't the demo team's.
+_Q_HISTORY = text(
+    """
+    SELECT c.title, c.summary, c.summary_through_id, h.id, h.role, h.content
+    FROM rag_chat_conversations c
+    LEFT JOIN LATERAL (
+        SELECT id, role, content, created_at
+        FROM rag_chat_messages
+        WHERE conversation_id = c.id
+        ORDER BY created_at DESC, id DESC
+        LIMIT :hist_limit
+    ) h ON TRUE
+    WHERE c.id = :cid
+      AND c.team_id = :team_id
+    ORDER BY h.created_at DESC, h.id DESC
+    """
+).bindparams(bindparam("hist_limit", type_=Integer))
+
+# Messages that fell out of the window and aren't in the summary yet,
+# oldest first. At most 100 per turn; a longer backlog is folded in over
+# the following turns, since summary_through_id only advances past what
+# was actually summarized.
+_Q_UNSUMMARIZED = text(
+    """
+    SELECT id, role, content
+    FROM rag_chat_messages
+    WHERE conversation_id = :cid
+      AND id > :after_id
+      AND id < :before_id
+    ORDER BY created_at ASC, id ASC
+    LIMIT 100
+    """
+)
+
+_Q_START_TURN = text(
+    """
+    WITH new_msg AS (
+        INSERT INTO rag_chat_messages (conversation_id, role, content, meta)
+        VALUES (:cid, 'user', :content, NULL)
+        RETURNING id, conversation_id, role, content, meta, created_at
+    ),
+    new_run AS (
+        INSERT INTO rag_chat_runs (conversation_id, user_message_id, status)
+        SELECT conversation_id, id, 'running' FROM new_msg
+        RETURNING id
+    )
+    SELECT new_msg.*, new_run.id AS run_id
+    FROM new_msg, new_run
+    """
+)
+
+_Q_FAIL_RUN = text(
+    """
+    UPDATE rag_chat_runs
+    SET status = 'failed',
+        error_message = :err,
+        updated_at = now()
+    WHERE id = :run_id
+    """
+).bindparams(bindparam("run_id", type_=Integer))
+
+_Q_FINISH_TURN = text(
+    """
+    WITH asst AS (
+        INSERT INTO rag_chat_messages (conversation_id, role, content, meta)
+        VALUES (:cid, 'assistant', :content, NULL)
+        RETURNING id, conversation_id, role, content, meta, created_at
+    ),
+    run_done AS (
+        UPDATE rag_chat_runs
+        SET status = 'completed',
+            error_message = NULL,
+            updated_at = now()
+        WHERE id = :run_id
+    ),
+    convo AS (
+        UPDATE rag_chat_conversations
+        SET
+          updated_at         = now(),
+          last_activity_at   = now(),
+          title              = COALESCE(title, :title),
+          summary            = COALESCE(:summary, summary),
+          summary_through_id = COALESCE(:summary_through_id, summary_through_id)
+        WHERE id = :cid
+        RETURNING id, team_id, title, created_at, updated_at, last_activity_at, archived
+    )
+    SELECT row_to_json(asst.*)  AS message,
+           row_to_json(convo.*) AS conversation
+    FROM asst, convo
+    """
+)
+
+_Q_DELETE_CONV = text(
+    """
+    DELETE FROM rag_chat_conversations
+    WHERE id = :cid
+      AND team_id = :team_id
+    RETURNING id
+    """
+)
+
+# PATCH only ever touches title and/or archived, so every SET list it
+# can produce is built here once.
+_Q_UPDATE_CONV = {
+    cols: text(
+        f"""
+        UPDATE rag_chat_conversations
+        SET {", ".join(f"{c} = :{c}" for c in cols)}, updated_at = now()
+        WHERE id = :cid
+          AND team_id = :team_id
+        RETURNING id, team_id, title, created_at, updated_at, last_activity_at, archived
+        """
+    )
+    for cols in (("title",), ("archived",), ("title", "archived"))
+}
+
+
 # ─────────────────────────────────────────
 # RAG chat helpers
 # ─────────────────────────────────────────
@@ -302,14 +657,7 @@ def _get_demo_conversation_or_404(db: Session, conversation_id: int) -> ChatConv
     No auth; everything is scoped to DEMO_TEAM_ID.
     """
     res = db.execute(
-        text(
-            """
-            SELECT id, team_id, title, created_at, updated_at, last_activity_at, archived
-            FROM rag_chat_conversations
-            WHERE id = :cid
-              AND team_id = :team_id
-            """
-        ),
+        _Q_GET_CONV,
         {"cid": conversation_id, "team_id": DEMO_TEAM_ID},
     )
     row = res.mappings().first()
@@ -318,35 +666,45 @@ def _get_demo_conversation_or_404(db: Session, conversation_id: int) -> ChatConv
     return _row_to_conversation(row)
 
 
-def _append_run_update(
-    db: Session,
-    run_id: int,
-    seq: int,
-    kind: str,
-    content: dict | None = None,
-) -> None:
+class RunUpdateBuffer:
     """
-    Insert a row into rag_chat_run_updates.
+    Collects rag_chat_run_updates rows for a single run and writes them
+    with one INSERT ... SELECT FROM jsonb_to_recordset(...) on flush(),
+    i.e. one parse + one execute regardless of how many rows are pending.
 
-    NOTE: seq must be an INT, kind must be a STRING, and content must be JSON-serializable.
+    seq is assigned here (monotonically increasing per run), kind is a
+    STRING and content must be JSON-serializable.
     """
-    payload = json.dumps(content or {})
 
-    db.execute(
-        text(
-            """
-            INSERT INTO rag_chat_run_updates (run_id, seq, kind, content)
-            VALUES (:run_id, :seq, :kind, CAST(:content AS JSONB))
-            """
-        ),
-        {
-            "run_id": run_id,
-            "seq": seq,
-            "kind": kind,
-            "content": payload,
-        },
-    )
-    db.commit()
+    def __init__(self, db: Session, run_id: int) -> None:
+        self.db = db
+        self.run_id = run_id
+        self.seq = 0
+        self.pending: List[Dict[str, Any]] = []
+
+    def append(self, kind: str, content: dict | None = None) -> None:
+        self.seq += 1
+        self.pending.append(
+            {"seq": self.seq, "kind": kind, "content": content or {}}
+        )
+
+    def flush(self, commit: bool = False) -> None:
+        """
+        Write every buffered row in one statement. With commit=True the
+        surrounding transaction is committed too, which makes the rows
+        visible to the run_updates poller.
+        """
+        if self.pending:
+            self.db.execute(
+                _Q_INSERT_RUN_UPDATES,
+                {
+                    "run_id": self.run_id,
+                    "batch": orjson.dumps(self.pending).decode(),
+                },
+            )
+            self.pending = []
+        if commit:
+            self.db.commit()
 
 
 # ─────────────────────────────────────────
@@ -354,36 +712,33 @@ def _append_run_update(
 # ─────────────────────────────────────────
 
 @router.get("/rag-chat/conversations", response_model=List[ChatConversation])
-def list_conversations(
+async def list_conversations(
     include_archived: bool = False,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    conn: asyncpg.Connection = Depends(get_app_conn),
 ):
     """
     List conversations for the demo team.
-    Sorted by most recent activity.
+    Sorted by most recent activity (ties broken by id, newest first).
+
+    Keyset pagination: pass the `last_activity_at` and `id` of the last
+    row you received as `before` / `before_id` to get the next page.
+    (`before` alone skips everything at that exact timestamp.)
     """
     limit = max(1, min(limit, 200))
 
-    res = db.execute(
-        text(
-            """
-            SELECT id, team_id, title, created_at, updated_at, last_activity_at, archived
-            FROM rag_chat_conversations
-            WHERE team_id = :team_id
-              AND (:include_archived OR archived = FALSE)
-            ORDER BY last_activity_at DESC
-            LIMIT :limit
-            """
-        ),
-        {
-            "team_id": DEMO_TEAM_ID,
-            "include_archived": include_archived,
-            "limit": limit,
-        },
+    rows = await conn.fetch(
+        _LIST_CONV_SQL,
+        DEMO_TEAM_ID,
+        include_archived,
+        before,
+        before_id,
+        limit,
     )
 
-    return [_row_to_conversation(r) for r in res.mappings().all()]
+    return [_row_to_conversation(r) for r in rows]
 
 
 @router.post("/rag-chat/conversations", response_model=ChatConversation)
@@ -396,13 +751,7 @@ def create_conversation(
     (The first user message is sent via POST /rag-chat/conversations/{id}/messages.)
     """
     res = db.execute(
-        text(
-            """
-            INSERT INTO rag_chat_conversations (team_id, title)
-            VALUES (:team_id, :title)
-            RETURNING id, team_id, title, created_at, updated_at, last_activity_at, archived
-            """
-        ),
+        _Q_CREATE_CONV,
         {"team_id": DEMO_TEAM_ID, "title": body.title},
     )
     row = res.mappings().one()
@@ -414,211 +763,178 @@ def create_conversation(
     "/rag-chat/conversations/{conversation_id}",
     response_model=ConversationWithMessages,
 )
-def get_conversation(
+async def get_conversation(
     conversation_id: int,
-    db: Session = Depends(get_db),
+    conn: asyncpg.Connection = Depends(get_app_conn),
 ):
     """
     Get a single conversation plus all messages for the demo team.
     """
-    convo = _get_demo_conversation_or_404(db, conversation_id)
+    row = await conn.fetchrow(_GET_CONV_SQL, conversation_id, DEMO_TEAM_ID)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
 
-    res = db.execute(
-        text(
-            """
-            SELECT id, conversation_id, role, content, meta, created_at
-            FROM rag_chat_messages
-            WHERE conversation_id = :cid
-            ORDER BY created_at ASC, id ASC
-            """
-        ),
-        {"cid": conversation_id},
+    rows = await conn.fetch(_LIST_MESSAGES_SQL, conversation_id)
+    messages = [_row_to_message(r) for r in rows]
+
+    return ConversationWithMessages(
+        conversation=_row_to_conversation(row),
+        messages=messages,
     )
-    messages = [_row_to_message(r) for r in res.mappings().all()]
 
-    return ConversationWithMessages(conversation=convo, messages=messages)
 
+def _load_history(db: Session, conversation_id: int) -> List[Any]:
+    """
+    _Q_HISTORY rows (newest first) for send_message; doubles as the
+    demo-team existence check, so there's no separate preflight SELECT.
+    """
+    hist_rows = db.execute(
+        _Q_HISTORY,
+        {"cid": conversation_id, "team_id": DEMO_TEAM_ID, "hist_limit": HISTORY_LIMIT},
+    ).mappings().all()
+    if not hist_rows:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    return hist_rows
 
-@router.post(
-    "/rag-chat/conversations/{conversation_id}/messages",
-    response_model=SendMessageResponse,
-)
-def send_message(
+
+def _run_turn(
+    db: Session,
     conversation_id: int,
-    body: SendMessageRequest,
-    db: Session = Depends(get_db),
-):
+    hist_rows: List[Any],
+    content: str,
+    on_token: Optional[Callable[[str], None]] = None,
+) -> SendMessageResponse:
     """
-    Add a user message to a conversation, call the LLM with full history,
-    store the assistant reply, and return both new messages.
+    One chat turn for send_message: store the user message, call the LLM
+    with the history window, store the assistant reply.
 
     For this version we also:
       - create a rag_chat_runs row for this turn
       - stream status updates into rag_chat_run_updates via a callback
         (e.g. "Analyzing question…", "Running SQL on Postgres…")
+      - forward reply tokens to on_token, if given
+
+    Transactions: one commit when the turn starts (user message + run +
+    first status), one per status tick from rag_core (the poller needs
+    to see those mid-run), and one at the end — success or failure.
     """
-    # Ensure this convo exists for the demo team
-    convo = _get_demo_conversation_or_404(db, conversation_id)
-
-    # 1) Insert user message
-    user_row_res = db.execute(
-        text(
-            """
-            INSERT INTO rag_chat_messages (conversation_id, role, content, meta)
-            VALUES (:cid, 'user', :content, NULL)
-            RETURNING id, conversation_id, role, content, meta, created_at
-            """
-        ),
+    # 1) hist_rows (see _load_history) hold the last HISTORY_LIMIT
+    #    messages + the running summary of anything older; the new user
+    #    message is appended in memory rather than re-read after the insert
+    title = hist_rows[0]["title"]
+    summary = hist_rows[0]["summary"]
+    summary_through_id = hist_rows[0]["summary_through_id"] or 0
+    window = [r for r in reversed(hist_rows) if r["id"] is not None]
+    history = [{"role": r["role"], "content": r["content"]} for r in window]
+    history.append({"role": "user", "content": content})
+
+    # 2) Insert the user message and create its run row in one round-trip
+    start_row = db.execute(
+        _Q_START_TURN,
         {
             "cid": conversation_id,
-            "content": body.content,
+            "content": content,
         },
-    )
-    user_msg_row = user_row_res.mappings().one()
-    user_msg = _row_to_message(user_msg_row)
-
-    # 2) Create a run row for this user message
-    run_row_res = db.execute(
-        text(
-            """
-            INSERT INTO rag_chat_runs (conversation_id, user_message_id, status)
-            VALUES (:cid, :mid, 'running')
-            RETURNING id
-            """
-        ),
-        {
-            "cid": conversation_id,
-            "mid": user_msg.id,
-        },
-    )
-    run_id = run_row_res.mappings().one()["id"]
+    ).mappings().one()
+    user_msg = _row_to_message(start_row)
+    run_id = start_row["run_id"]
 
-    # 3) Closure to append run updates with a monotonically increasing seq
-    seq_counter = {"value": 0}
+    # 3) Buffer run updates; flushed at checkpoints instead of one commit each
+    run_updates = RunUpdateBuffer(db, run_id)
 
     def append_run_update(kind: str, content: dict | None = None) -> None:
         """
+        Callback for rag_core. Status ticks are emitted right before a
+        slow tool call / LLM round-trip, so flush them straight away for
+        the run_updates poller.
+
         kind: 'status', 'assistant_final', 'error', etc.
         content: JSON payload, e.g. {"text": "Running SQL on Postgres…"}
         """
-        seq_counter["value"] += 1
-        _append_run_update(
-            db=db,
-            run_id=run_id,
-            seq=seq_counter["value"],
-            kind=kind,
-            content=content or {},
-        )
+        run_updates.append(kind, content)
+        run_updates.flush(commit=True)
 
-    # Initial status for this run
-    append_run_update("status", {"text": "Analyzing question…"})
-
-    # 4) Load full history (including this new user message)
-    res_hist = db.execute(
-        text(
-            """
-            SELECT role, content
-            FROM rag_chat_messages
-            WHERE conversation_id = :cid
-            ORDER BY created_at ASC, id ASC
-            """
-        ),
-        {"cid": conversation_id},
-    )
-    history = [
-        {"role": row["role"], "content": row["content"]}
-        for row in res_hist.mappings().all()
-    ]
+    # Initial status for this run, committed together with the
+    # user message and the run row.
+    run_updates.append("status", {"text": "Analyzing question…"})
+    run_updates.flush(commit=True)
 
-    # 5) Call LLM with history (delegates to rag_chat_core) and stream updates
+    # 4) Call LLM with history (delegates to rag_chat_core) and stream updates
     try:
         assistant_text = rag_core.call_llm_with_history(
             history,
             on_update=append_run_update,
+            summary=summary,
+            on_token=on_token,
         )
     except Exception as e:
-        # Mark run as failed and record an error update, then re-raise
-        append_run_update("error", {"text": "Assistant failed.", "detail": str(e)})
+        # Discard whatever the failed turn left half-written, then record
+        # the error update + failed status in one transaction and re-raise
+        db.rollback()
+        run_updates.pending.clear()
+        run_updates.append("error", {"text": "Assistant failed.", "detail": str(e)})
+        run_updates.flush()
         db.execute(
-            text(
-                """
-                UPDATE rag_chat_runs
-                SET status = 'failed',
-                    error_message = :err,
-                    updated_at = now()
-                WHERE id = :run_id
-                """
-            ),
+            _Q_FAIL_RUN,
             {"err": str(e), "run_id": run_id},
         )
         db.commit()
         raise
 
     # Optional: final status update with a preview of the answer
-    append_run_update(
+    # (buffered; written with the final commit below)
+    run_updates.append(
         "assistant_final",
         {"text": (assistant_text[:4000] if assistant_text else "")},
     )
 
-    # Mark run as completed
-    db.execute(
-        text(
-            """
-            UPDATE rag_chat_runs
-            SET status = 'completed',
-                error_message = NULL,
-                updated_at = now()
-            WHERE id = :run_id
-            """
-        ),
-        {"run_id": run_id},
-    )
-
-    # 6) Insert assistant message
-    asst_row_res = db.execute(
-        text(
-            """
-            INSERT INTO rag_chat_messages (conversation_id, role, content, meta)
-            VALUES (:cid, 'assistant', :content, NULL)
-            RETURNING id, conversation_id, role, content, meta, created_at
-            """
-        ),
-        {
-            "cid": conversation_id,
-            "content": assistant_text,
-        },
-    )
-    asst_msg_row = asst_row_res.mappings().one()
-    asst_msg = _row_to_message(asst_msg_row)
-
-    # 7) Generate AI title IF the conversation doesn't already have one
+    # 5) Generate AI title IF the conversation doesn't already have one
     new_title: Optional[str] = None
-    if not (convo.title and convo.title.strip()):
+    if not (title and title.strip()):
         new_title = rag_core.generate_conversation_title(history)
         # If generation failed or returned empty, leave title as NULL in DB
         if new_title is not None:
             new_title = new_title.strip() or None
 
-    # 8) Update conversation timestamps and (if needed) title
-    db.execute(
-        text(
-            """
-            UPDATE rag_chat_conversations
-            SET
-              updated_at       = now(),
-              last_activity_at = now(),
-              title            = COALESCE(title, :title)
-            WHERE id = :cid
-            """
-        ),
-        {"cid": conversation_id, "title": new_title},
-    )
-
-    # Final commit for messages + convo + run status
-    db.commit()
+    # Re-summarize once enough messages have dropped out of a full window.
+    # Best-effort like the title: on failure the old summary is kept.
+    new_summary: Optional[str] = None
+    new_summary_through_id: Optional[int] = None
+    if len(window) >= HISTORY_LIMIT:
+        dropped = db.execute(
+            _Q_UNSUMMARIZED,
+            {
+                "cid": conversation_id,
+                "after_id": summary_through_id,
+                "before_id": window[0]["id"],
+            },
+        ).mappings().all()
+        if len(dropped) >= SUMMARY_EVERY:
+            new_summary = rag_core.summarize_history(
+                summary,
+                [{"role": r["role"], "content": r["content"]} for r in dropped],
+            )
+            if new_summary is not None:
+                new_summary_through_id = dropped[-1]["id"]
+
+    # 6) One round-trip: insert the assistant message, mark the run as
+    #    completed, bump conversation timestamps / title and read it back
+    final_row = db.execute(
+        _Q_FINISH_TURN,
+        {
+            "cid": conversation_id,
+            "content": assistant_text,
+            "run_id": run_id,
+            "title": new_title,
+            "summary": new_summary,
+            "summary_through_id": new_summary_through_id,
+        },
+    ).mappings().one()
+    asst_msg = _row_to_message(final_row["message"])
+    refreshed = _row_to_conversation(final_row["conversation"])
 
-    # Refresh convo row (to get updated_at/last_activity_at/title)
-    refreshed = _get_demo_conversation_or_404(db, conversation_id)
+    # Final commit for messages + convo + run status + buffered updates
+    run_updates.flush(commit=True)
 
     return SendMessageResponse(
         conversation=refreshed,
@@ -626,6 +942,78 @@ def send_message(
     )
 
 
+def _sse(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def _stream_turn(
+    conversation_id: int,
+    hist_rows: List[Any],
+    content: str,
+) -> Iterator[bytes]:
+    """
+    Run _run_turn on a worker thread with its own Session (the request's
+    one is closed once the response starts) and relay it as SSE frames:
+    `token` per text delta, then `done` (SendMessageResponse) or `error`.
+    The turn still finishes and is stored if the client goes away.
+    """
+    events: "queue.Queue[Optional[tuple]]" = queue.Queue()
+
+    def worker() -> None:
+        db = SessionLocal()
+        try:
+            resp = _run_turn(
+                db,
+                conversation_id,
+                hist_rows,
+                content,
+                on_token=lambda t: events.put(("token", {"text": t})),
+            )
+            events.put(("done", resp.model_dump(mode="json")))
+        except Exception as e:
+            events.put(("error", {"detail": str(e)}))
+        finally:
+            db.close()
+            events.put(None)
+
+    threading.Thread(target=worker, daemon=True).start()
+    while True:
+        item = events.get()
+        if item is None:
+            return
+        yield _sse(*item)
+
+
+@router.post(
+    "/rag-chat/conversations/{conversation_id}/messages",
+    response_model=SendMessageResponse,
+)
+def send_message(
+    conversation_id: int,
+    body: SendMessageRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """
+    Add a user message to a conversation, call the LLM with recent history,
+    store the assistant reply, and return both new messages.
+
+    With `Accept: text/event-stream` the reply is streamed instead
+    (see _stream_turn); the default is a single JSON SendMessageResponse.
+    """
+    # 404s here (before any streaming starts) if the convo isn't the demo team's
+    hist_rows = _load_history(db, conversation_id)
+
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_turn(conversation_id, hist_rows, body.content),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return _run_turn(db, conversation_id, hist_rows, body.content)
+
+
 @router.patch(
     "/rag-chat/conversations/{conversation_id}",
     response_model=ChatConversation,
@@ -639,36 +1027,27 @@ def update_conversation(
     Update conversation metadata (currently: title and archived flag)
     for the demo team.
     """
-    # Ensure it exists for the demo team
-    _ = _get_demo_conversation_or_404(db, conversation_id)
-
-    updates = []
-    params: Dict[str, Any] = {"cid": conversation_id}
+    params: Dict[str, Any] = {"cid": conversation_id, "team_id": DEMO_TEAM_ID}
 
     if body.title is not None:
-        updates.append("title = :title")
         params["title"] = body.title
 
     if body.archived is not None:
-        updates.append("archived = :archived")
         params["archived"] = body.archived
 
-    if not updates:
+    cols = tuple(c for c in ("title", "archived") if c in params)
+    if not cols:
         # Nothing to change
         return _get_demo_conversation_or_404(db, conversation_id)
 
     # Any metadata change bumps updated_at,
     # but DOES NOT change last_activity_at.
-    updates.append("updated_at = now()")
-
-    set_clause = ", ".join(updates)
-    db.execute(
-        text(f"UPDATE rag_chat_conversations SET {set_clause} WHERE id = :cid"),
-        params,
-    )
+    row = db.execute(_Q_UPDATE_CONV[cols], params).mappings().first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
     db.commit()
 
-    return _get_demo_conversation_or_404(db, conversation_id)
+    return _row_to_conversation(row)
 
 
 @router.delete("/rag-chat/conversations/{conversation_id}", status_code=204)
@@ -678,23 +1057,16 @@ def delete_conversation(
 ):
     """
     Permanently delete a conversation and all its messages for the demo team.
-    """
-    # Ensure it exists for the demo team
-    _ = _get_demo_conversation_or_404(db, conversation_id)
 
-    # Delete messages first due to FK constraints
-    db.execute(
-        text(
-            "DELETE FROM rag_chat_messages WHERE conversation_id = :cid"
-        ),
-        {"cid": conversation_id},
-    )
-    db.execute(
-        text(
-            "DELETE FROM rag_chat_conversations WHERE id = :cid"
-        ),
-        {"cid": conversation_id},
-    )
+    Messages, runs and run updates go with it via ON DELETE CASCADE
+    (see ai/rag_chat/bootstrap.sql); RETURNING doubles as the 404 check.
+    """
+    deleted = db.execute(
+        _Q_DELETE_CONV,
+        {"cid": conversation_id, "team_id": DEMO_TEAM_ID},
+    ).first()
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
     db.commit()
 
     return Response(status_code=204)
@@ -715,72 +1087,163 @@ class RunUpdatesResponse(BaseModel):
     updates: List[RunUpdate]
 
 
+# Upper bound for the long-poll `wait` (seconds); stays under common proxy idle timeouts.
+RUN_UPDATES_MAX_WAIT = 25
+
+# NOTIFY channel of the rag_chat_run_updates / rag_chat_runs triggers
+# (see ai/rag_chat/bootstrap.sql); the payload is the run id.
+RUN_UPDATES_CHANNEL = "rag_chat_run_upd"
+
+
+class _RunUpdateListener:
+    """
+    One LISTEN connection per process, fanned out to the long-polls waiting
+    on each run. Waiting therefore holds no pool connection: a poller only
+    borrows one from the app pool for its reads.
+    """
+
+    def __init__(self) -> None:
+        self._conn: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._waiters: Dict[int, set] = {}
+
+    async def _ensure_connected(self) -> None:
+        if self._conn is not None and not self._conn.is_closed():
+            return
+        async with self._lock:
+            if self._conn is not None and not self._conn.is_closed():
+                return
+            conn = await asyncpg.connect(APP_DB_DSN)
+            await conn.add_listener(RUN_UPDATES_CHANNEL, self._on_notify)
+            conn.add_termination_listener(self._on_lost)
+            self._conn = conn
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        try:
+            run_id = int(payload)
+        except ValueError:
+            return
+        for event in self._waiters.get(run_id, ()):
+            event.set()
+
+    def _on_lost(self, _conn) -> None:
+        # Wake everyone so they re-read; the next watch() reconnects.
+        self._conn = None
+        for events in self._waiters.values():
+            for event in events:
+                event.set()
+
+    @asynccontextmanager
+    async def watch(self, run_id: int) -> AsyncIterator[asyncio.Event]:
+        """Event set on the next NOTIFY for `run_id` (LISTEN is already on)."""
+        await self._ensure_connected()
+        event = asyncio.Event()
+        self._waiters.setdefault(run_id, set()).add(event)
+        try:
+            yield event
+        finally:
+            events = self._waiters.get(run_id)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del self._waiters[run_id]
+
+
+_run_update_listener = _RunUpdateListener()
+
+
+async def _fetch_run_updates(
+    conn: asyncpg.Connection,
+    run_id: int,
+    since_seq: Optional[int],
+) -> List[RunUpdate]:
+    rows = await conn.fetch(_LIST_RUN_UPDATES_SQL, run_id, since_seq)
+    updates = []
+    for r in rows:
+        updates.append(
+            RunUpdate(
+                id=r["id"],
+                run_id=r["run_id"],
+                seq=r["seq"],
+                kind=r["kind"],
+                content=r["content"] or {},
+                created_at=r["created_at"],
+            )
+        )
+    return updates
+
+
+async def _fetch_latest_run(
+    conn: asyncpg.Connection,
+    conversation_id: int,
+    since_seq: Optional[int],
+):
+    """
+    (id/status row of the conversation's latest run, its updates after
+    since_seq); 404 if the conversation isn't the demo team's.
+    """
+    run_row = await conn.fetchrow(_LATEST_RUN_SQL, conversation_id, DEMO_TEAM_ID)
+    if run_row is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    if run_row["id"] is None:
+        return run_row, []
+    return run_row, await _fetch_run_updates(conn, run_row["id"], since_seq)
+
+
+async def _fetch_run_state(
+    conn: asyncpg.Connection,
+    run_id: int,
+    since_seq: Optional[int],
+):
+    """(current status, updates after since_seq) for one run."""
+    status = await conn.fetchval(_RUN_STATUS_SQL, run_id)
+    return status, await _fetch_run_updates(conn, run_id, since_seq)
+
+
 @router.get(
     "/rag-chat/conversations/{conversation_id}/run_updates",
     response_model=RunUpdatesResponse,
 )
-def get_run_updates(
+async def get_run_updates(
     conversation_id: int,
     since_seq: Optional[int] = None,
-    db: Session = Depends(get_db),
+    wait: int = 0,
 ):
     """
     Return updates for the *latest* run on this conversation (demo team only).
 
-    Frontend can poll this every ~5 seconds.
-    """
-    # Ensure the conversation exists for the demo team
-    _ = _get_demo_conversation_or_404(db, conversation_id)
-
-    # Find the latest run for this conversation
-    run_row = db.execute(
-        text(
-            """
-            SELECT id, status
-            FROM rag_chat_runs
-            WHERE conversation_id = :cid
-            ORDER BY id DESC
-            LIMIT 1
-            """
-        ),
-        {"cid": conversation_id},
-    ).mappings().first()
-
-    if not run_row:
+    Long-poll: with `wait` > 0 (capped at RUN_UPDATES_MAX_WAIT) and a
+    running run that has nothing new after `since_seq`, the request waits
+    on the process-wide listener (_RunUpdateListener) and returns as soon
+    as a NOTIFY for the run arrives (a new update, or the run finishing /
+    failing), or empty-handed on timeout. No pool connection is held
+    while it waits. With the default `wait=0` it answers immediately, so
+    plain polling every ~5 seconds keeps working.
+    """
+    pool = await _get_app_pool()
+    async with pool.acquire() as conn:
+        run_row, updates = await _fetch_latest_run(conn, conversation_id, since_seq)
+    if run_row["id"] is None:
         return RunUpdatesResponse(run_id=None, status=None, updates=[])
 
     run_id = run_row["id"]
     status = run_row["status"]
 
-    params: Dict[str, Any] = {"run_id": run_id}
-    where = "run_id = :run_id"
-    if since_seq is not None:
-        where += " AND seq > :since_seq"
-        params["since_seq"] = since_seq
-
-    rows = db.execute(
-        text(
-            f"""
-            SELECT id, run_id, seq, kind, content, created_at
-            FROM rag_chat_run_updates
-            WHERE {where}
-            ORDER BY seq ASC
-            """
-        ),
-        params,
-    ).mappings().all()
-
-    updates = [
-        RunUpdate(
-            id=r["id"],
-            run_id=r["run_id"],
-            seq=r["seq"],
-            kind=r["kind"],
-            content=r["content"] or {},
-            created_at=r["created_at"],
-        )
-        for r in rows
-    ]
+    wait = max(0, min(wait, RUN_UPDATES_MAX_WAIT))
+    if not updates and status == "running" and wait:
+        async with _run_update_listener.watch(run_id) as notified:
+            # Re-check once we're listening so an update (or the run
+            # ending) between the first read and LISTEN isn't missed.
+            async with pool.acquire() as conn:
+                status, updates = await _fetch_run_state(conn, run_id, since_seq)
+            if not updates and status == "running":
+                try:
+                    await asyncio.wait_for(notified.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    async with pool.acquire() as conn:
+                        status, updates = await _fetch_run_state(conn, run_id, since_seq)
 
     return RunUpdatesResponse(
         run_id=run_id,
@@ -1,14 +1,20 @@
 # app/routers/subs.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import text
-from sqlalchemy.orm import Session, joinedload
+import base64
+import json
+from datetime import datetime
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ARRAY, RowMapping, String, bindparam, func, select, text, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from typing import List, Optional, Literal, Tuple, Dict
+from typing import Iterable, Iterator, List, Optional, Literal, Tuple, Dict
 from ..auth_dep import require_team_or_higher, require_writer, require_admin
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from .. import models, schemas
 
 
@@ -16,11 +22,69 @@ router = APIRouter(prefix="/subs", tags=["subs"])
 
 
 # helpers
+
+# sub_list_rows (sub_list_view kept as a table) columns SubListRow needs.
+# sub_list_view isn't guaranteed to expose created_at, so it comes from subs
+# (a primary-key lookup per page row), falling back to updated_at in SQL so
+# rows validate without a Python fix-up pass
+_SUB_LIST_COLUMNS = """
+    sub_id,
+    COALESCE(
+      (SELECT s.created_at FROM subs s WHERE s.id = sub_list_rows.sub_id),
+      updated_at
+    ) AS created_at,
+    updated_at,
+    clients, clients_list,
+    project_id, project_title,
+    media_type, intent_primary,
+    executives, recipient_company, recipients,
+    result, feedback_count, has_positive
+"""
+
+# rows per server-side cursor fetch on the NDJSON path
+_STREAM_BATCH = 500
+
+@lru_cache(maxsize=256)
+def _list_stmts(where_sql: str, page_where: str, total_col: str):
+    """
+    (page_stmt, count_stmt) for one filter shape. WHERE fragments come from
+    a fixed set in `_list_subs`, so the number of distinct keys is bounded
+    and repeat requests reuse the same text() objects (and their compiled
+    cache entries) instead of rebuilding them.
+    """
+    base_sql = f"FROM sub_list_rows WHERE {where_sql}"
+    page_stmt = text(
+        f"""
+        SELECT {_SUB_LIST_COLUMNS}{total_col}
+        {base_sql} {page_where}
+        ORDER BY updated_at DESC, sub_id DESC
+        LIMIT :limit OFFSET :offset
+        """
+    )
+    count_stmt = text(f"SELECT COUNT(*) {base_sql}")
+    return page_stmt, count_stmt
+
+
+def _encode_cursor(updated_at: datetime, sub_id: str) -> str:
+    """Opaque keyset cursor: base64url of [updated_at, sub_id] of the last row."""
+    raw = json.dumps([updated_at.isoformat(), sub_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ts, sub_id = json.loads(raw)
+        return datetime.fromisoformat(ts), str(sub_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid cursor") from exc
+
 def _list_subs(
     db: Session,
     *,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
     since_days: int | None = None,
     clients: Optional[List[str]] = None,
     executives: Optional[List[str]] = None,
@@ -30,12 +94,27 @@ def _list_subs(
     intent: Optional[str] = None,
     company: Optional[str] = None,
     result: Optional[str] = None,
-    feedback_filter: Optional[str] = None     # '', '0', 'positive', 'not_positive'
-) -> Tuple[int, List[dict]]:
+    feedback_filter: Optional[str] = None,    # '', '0', 'positive', 'not_positive'
+    stream: bool = False,
+) -> Tuple[Optional[int], Iterable[RowMapping], Optional[str]]:
     """
-    Query *sub_list_view* and return (total_count, rows).
+    Query *sub_list_rows* and return (total_count, rows, next_cursor).
+    sub_list_rows is sub_list_view stored as a table (triggers re-derive a
+    sub's row whenever something it shows changes), so filters hit plain
+    indexed columns.
     Either `project_id` **or** `project_title` may be supplied.
-    Each row is returned as a plain dict via SQLAlchemy `.mappings()`.
+    Rows are the SQLAlchemy `.mappings()` themselves (SubListRow's columns),
+    handed to the response model as-is.
+
+    Paging is newest-first on (updated_at, sub_id). With `cursor` (the
+    `next_cursor` of the previous page) the page is a keyset range read;
+    without it `offset` is used. next_cursor is None on the last page.
+
+    total_count is None unless `with_total`, and then always exact.
+
+    With `stream` the rows come back as a lazy iterator over a server-side
+    cursor (fetched `_STREAM_BATCH` at a time) and there is no total or
+    next_cursor; the caller must consume it before the session closes.
     """
     # ------------------------------------------------------------------
     # 0) WHERE-clause builder
@@ -55,6 +134,7 @@ def _list_subs(
     # ------------------------------------------------------------------
     # 1) Filters supplied by caller
     # ------------------------------------------------------------------
+    # Substring filters ('%term%') are served by sub_list_rows' pg_trgm indexes.
     if clients:
         # ILIKE ANY expects patterns; wrap each term in %...%
         patterns = [f"%{c}%" for c in clients]
@@ -96,125 +176,134 @@ def _list_subs(
     # ------------------------------------------------------------------
     # 2) Compose SQL
     # ------------------------------------------------------------------
-    where_sql = " AND ".join(where)
-    base_sql = f"FROM sub_list_view WHERE {where_sql}"
+    where_sql = " AND ".join(where) or "TRUE"
 
     # ------------------------------------------------------------------
-    # 3) Execute COUNT and page query
+    # 3) Page query (+ the total, only if asked for)
     # ------------------------------------------------------------------
-    total: int = db.execute(
-        text(f"SELECT COUNT(*) {base_sql}"),
-        params,
-    ).scalar_one()
+    total: Optional[int] = None
+
+    if cursor:
+        cur_ts, cur_id = _decode_cursor(cursor)
+        page_where = "AND (updated_at, sub_id) < (:cur_ts, :cur_id)"
+        page_params = {**params, "cur_ts": cur_ts, "cur_id": cur_id, "offset": 0}
+    else:
+        page_where = ""
+        page_params = {**params, "offset": offset}
+
+    # On an offset page the exact total rides along as a window count,
+    # so the WHERE is evaluated once in a single round-trip. (A cursor
+    # page's window would only count rows past the cursor.)
+    window_total = with_total and not cursor and not stream
+    total_col = ", COUNT(*) OVER () AS _total" if window_total else ""
+    page_stmt, count_stmt = _list_stmts(where_sql, page_where, total_col)
+
+    if stream:
+        result = db.execute(
+            page_stmt,
+            {**page_params, "limit": limit},
+            execution_options={"yield_per": _STREAM_BATCH},
+        )
+        return None, result.mappings(), None
 
+    # one extra row tells us whether there is a next page
     raw_rows = (
-        db.execute(
-            text(
-                f"""
-                SELECT *
-                {base_sql}
-                ORDER BY updated_at DESC
-                LIMIT :limit OFFSET :offset
-                """
-            ),
-            {**params, "limit": limit, "offset": offset},
-        )
+        db.execute(page_stmt, {**page_params, "limit": limit + 1})
         .mappings()
         .all()
     )
 
-    # Ensure `created_at` exists for response validation.
-    rows: List[dict] = []
-    for m in raw_rows:
-        d = dict(m)
-        # If sub_list_view doesn't expose created_at, fall back to updated_at
-        if "created_at" not in d or d["created_at"] is None:
-            d["created_at"] = d.get("updated_at")
-        rows.append(d)
-
-    return total, rows
-
-
-def _mk_recipient_mini(db: Session, r: models.SubRecipient) -> schemas.RecipientMini:
-    # ── 1. look up the person’s name by type ──────────────────────────
-    if r.recipient_type == "executive":
-        person_name = db.query(models.Executive.name) \
-                        .filter(models.Executive.id == r.recipient_id) \
-                        .scalar()
-    elif r.recipient_type == "external_rep":
-        person_name = db.query(models.ExternalTalentRep.name) \
-                        .filter(models.ExternalTalentRep.id == r.recipient_id) \
-                        .scalar()
-    elif r.recipient_type == "creative":                         # ← NEW branch
-        person_name = db.query(models.Creative.name) \
-                        .filter(models.Creative.id == r.recipient_id) \
-                        .scalar()
-    else:                                                        # safety fallback
-        person_name = None
-    # ── 2. resolve company (exec only) ──
-    company_name: str | None = None
-    if r.recipient_company:
-        prefix = r.recipient_company[:2]          # 'NW‘ | 'ST' | 'PC'
-        table = {
-            "NW": models.TVNetwork,
-            "ST": models.Studio,
-            "PC": models.ProductionCompany,
-        }.get(prefix)
-        if table:
-            company_name = db.query(table.name)\
-                             .filter(table.id == r.recipient_company)\
-                             .scalar()
-    return schemas.RecipientMini(
+    if window_total and raw_rows:
+        total = raw_rows[0]["_total"]
+    elif with_total and (cursor or offset):
+        # cursor page, or an offset past the end: nothing to read it from
+        total = db.execute(count_stmt, params).scalar_one()
+    elif with_total:
+        total = 0
+
+    next_cursor: Optional[str] = None
+    if len(raw_rows) > limit:
+        raw_rows = raw_rows[:limit]
+        last = raw_rows[-1]
+        next_cursor = _encode_cursor(last["updated_at"], last["sub_id"])
+
+    # (an extra `_total` key is ignored by SubListRow)
+    return total, list(raw_rows), next_cursor
+
+
+def _stream_subs_ndjson(**kw) -> Iterator[str]:
+    """
+    One SubListRow JSON object per line. Runs after the request's own
+    session is gone, so it holds a session of its own for the cursor.
+    """
+    db = SessionLocal()
+    try:
+        _, rows, _ = _list_subs(db, stream=True, **kw)
+        for row in rows:
+            yield schemas.SubListRow.from_orm_trusted(row).model_dump_json() + "\n"
+    finally:
+        db.close()
+
+
+def _mk_recipient_mini(r: models.SubRecipientEnriched) -> schemas.RecipientMini:
+    return schemas.RecipientMini.model_construct(
         id            = r.recipient_id,
         type          = r.recipient_type,         # 'executive' | 'external_rep' | 'creative'
-        name          = person_name or r.recipient_id,
+        name          = r.person_name or r.recipient_id,
         company_id    = r.recipient_company,      # stays for reference
-        company_name  = company_name,             # ← add this
+        company_name  = r.company_name,
     )
 
 def _mk_project_need_mini(pn: models.ProjectNeed | None) -> schemas.ProjectNeedMini | None:
     if not pn:
         return None
-    return schemas.ProjectNeedMini.model_validate(pn)
+    return schemas.ProjectNeedMini.from_orm_trusted(pn)
 
 def _mk_mandate_mini(m: models.Mandate) -> schemas.MandateMini:
-    return schemas.MandateMini.model_validate(m)
+    return schemas.MandateMini.from_orm_trusted(m)
 
 def _get_sub(db: Session, sub_id: str) -> schemas.SubDetail | None:
     s: models.Sub | None = (
         db.query(models.Sub)
           .options(
+              # to-one: joined into the main row
               joinedload(models.Sub.project),
               joinedload(models.Sub.project_need),
-              joinedload(models.Sub.clients),
-              joinedload(models.Sub.originators),
-              joinedload(models.Sub.recipients),
-              joinedload(models.Sub.writing_samples),
-              joinedload(models.Sub.feedback),
-              joinedload(models.Sub.mandates),
+              joinedload(models.Sub.creator),
+              # collections: one `WHERE sub_id IN (...)` SELECT each, so the
+              # main query returns 1 row instead of their cartesian product
+              selectinload(models.Sub.clients),
+              selectinload(models.Sub.originators),
+              selectinload(models.Sub.recipients_enriched),
+              selectinload(models.Sub.writing_samples),
+              selectinload(models.Sub.feedback),
+              selectinload(models.Sub.mandates),
+              # anything else (e.g. the writable `recipients`) is neither
+              # loaded nor allowed to lazy-load while building SubDetail
+              raiseload("*"),
           )
           .filter(models.Sub.id == sub_id)
           .first()
     )
     if not s:
         return None
-    return schemas.SubDetail(
+    # everything below comes straight from the DB, so skip re-validation
+    return schemas.SubDetail.model_construct(
         id             = s.id,
-        project        = s.project,
+        project        = (schemas.ProjectMini.from_orm_trusted(s.project)
+                          if s.project else None),
         intent_primary = s.intent_primary,
         project_need   = _mk_project_need_mini(s.project_need),
         result         = s.result,
         created_at     = s.created_at,
         updated_at     = s.updated_at,
-        created_by = (schemas.ManagerMini.model_validate({
-                "id":   s.creator.id,
-                "name": s.creator.name,
-            }) if s.creator else None),
-        clients        = [schemas.CreativeMini.model_validate(c) for c in s.clients],
-        originators    = [schemas.ManagerMini.model_validate(m) for m in s.originators],
-        recipients     = [_mk_recipient_mini(db, r)             for r in s.recipients],
-        writing_samples= [schemas.WritingSampleBase.model_validate(ws) for ws in s.writing_samples],
-        feedback       = [schemas.SubFeedbackMini.model_validate(f)    for f in s.feedback],
+        created_by = (schemas.ManagerMini.from_orm_trusted(s.creator)
+                      if s.creator else None),
+        clients        = [schemas.CreativeMini.from_orm_trusted(c) for c in s.clients],
+        originators    = [schemas.ManagerMini.from_orm_trusted(m) for m in s.originators],
+        recipients     = [_mk_recipient_mini(r) for r in s.recipients_enriched],
+        writing_samples= [schemas.WritingSampleBase.from_orm_trusted(ws) for ws in s.writing_samples],
+        feedback       = [schemas.SubFeedbackMini.from_orm_trusted(f)    for f in s.feedback],
         mandates       = [_mk_mandate_mini(m) for m in s.mandates],
     )
 
@@ -222,26 +311,6 @@ def _get_sub(db: Session, sub_id: str) -> schemas.SubDetail | None:
 # ────────────────────────────────────────────────────────────────
 #  Pydantic helpers for create / join‑table endpoints
 # ────────────────────────────────────────────────────────────────
-class _RecipientIn(schemas.BaseModel):
-    recipient_type: Literal["executive", "external_rep", "creative"]
-    recipient_id:   str
-    recipient_company: Optional[str] = None
-
-class SubCreate(schemas.BaseModel):
-    # core columns
-    project_id:        str
-    intent_primary:    Optional[str] = None
-    project_need_id:   Optional[str] = None
-    result:            Optional[str] = None
-    created_by:        str = "TM_00011"    # replace with session user when ready
-
-    # join‑table payloads (all optional)
-    client_ids:         List[str]          = []
-    originator_ids:     List[str]          = []   # team IDs
-    recipient_rows:     List[_RecipientIn] = []
-    mandate_ids:        List[str]          = []
-    writing_sample_ids: List[str]          = []
-
 class JoinIds(schemas.BaseModel):
     ids: List[str]
 
@@ -250,8 +319,11 @@ class JoinIds(schemas.BaseModel):
 # ────────────────────────────────────────────────────────────────
 @router.get("", response_model=schemas.PagedSubs, dependencies=[Depends(require_team_or_higher)])
 def list_subs(
+    request: Request,
     limit: int  = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,             # ← next_cursor from the previous page
+    with_total: bool = False,                 # ← count matches (page-number UIs)
     since_days: int | None = None,
 
     # query‑string filters
@@ -270,11 +342,18 @@ def list_subs(
     Generic /subs listing endpoint.
     - `project_id` filters exact, `project` does a title ILIKE.
     - All args are optional.
+    - Pass `cursor` (the previous page's `next_cursor`) for keyset paging;
+      `offset` still works for page-number UIs but costs more on deep pages.
+    - `total` is only filled in with `with_total=1`; otherwise use
+      `next_cursor` (null on the last page) to tell if there is more.
+    - With `Accept: application/x-ndjson` the matching rows are streamed,
+      one SubListRow per line (no total / next_cursor) - for exports and
+      other large `limit`s.
     """
-    total, rows = _list_subs(
-        db,
+    filters = dict(
         limit=limit,
         offset=offset,
+        cursor=cursor,
         since_days=since_days,
         clients=client,
         executives=executives,
@@ -286,7 +365,16 @@ def list_subs(
         result=result,
         feedback_filter=feedback,
     )
-    return {"total": total, "items": rows}
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        if cursor:
+            _decode_cursor(cursor)      # bad cursor → 400 before streaming starts
+        return StreamingResponse(
+            _stream_subs_ndjson(**filters), media_type="application/x-ndjson"
+        )
+
+    total, rows, next_cursor = _list_subs(db, with_total=with_total, **filters)
+    items = [schemas.SubListRow.from_orm_trusted(r) for r in rows]
+    return {"total": total, "items": items, "next_cursor": next_cursor}
 
 
 @router.get("/{sub_id}", response_model=schemas.SubDetail, dependencies=[Depends(require_team_or_higher)])
@@ -297,23 +385,47 @@ def get_sub(sub_id: str, db: Session = Depends(get_db)):
     return sub
 
 
-@router.patch("/{sub_id}", response_model=schemas.SubDetail, dependencies=[Depends(require_writer)])
-def patch_sub(sub_id: str, patch: schemas.SubUpdate, db: Session = Depends(get_db)):
-    s = db.query(models.Sub).filter(models.Sub.id == sub_id).first()
-    if not s:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Sub not found")
-
-    # for fld in ("result", "intent_primary", "project_need_id"):
-    #     val = getattr(patch, fld)
-    #     if val is not None:
-    #         setattr(s, fld, val)
-
-    for fld, val in patch.model_dump(exclude_unset=True).items():
-        setattr(s, fld, val)
+# SubUpdate's list fields are not columns of `subs`; they are managed through
+# the join-table endpoints below and ignored here.
+_SUB_PATCH_COLUMNS = ("project_id", "intent_primary", "project_need_id", "result")
 
+@router.patch(
+    "/{sub_id}",
+    response_model=schemas.SubMini | schemas.SubDetail,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(require_writer)],
+)
+def patch_sub(
+    sub_id: str,
+    patch: schemas.SubUpdate,
+    return_: Literal["minimal", "full"] = Query("minimal", alias="return"),
+    db: Session = Depends(get_db),
+):
+    """
+    One `UPDATE ... RETURNING updated_at`. Responds with the changed fields
+    (SubMini); pass `?return=full` for the whole SubDetail.
+    """
+    values = {
+        k: v for k, v in patch.model_dump(exclude_unset=True).items()
+        if k in _SUB_PATCH_COLUMNS
+    }
+    try:
+        updated_at = db.execute(
+            update(models.Sub)
+            .where(models.Sub.id == sub_id)
+            .values(**values)
+            .returning(models.Sub.updated_at)
+        ).scalar_one_or_none()
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(400, f"Integrity error: {exc.orig}") from exc
+    if updated_at is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Sub not found")
     db.commit()
-    db.refresh(s)
-    return _get_sub(db, sub_id)
+
+    if return_ == "full":
+        return _get_sub(db, sub_id)
+    return schemas.SubMini(id=sub_id, updated_at=updated_at, **values)
 
 
 @router.delete("/{sub_id}", status_code=204, dependencies=[Depends(require_writer)])
@@ -326,188 +438,239 @@ def delete_sub(sub_id: str, db: Session = Depends(get_db)):
 # ────────────────────────────────────────────────────────────────
 #  CREATE  (core + optional join rows)
 # ────────────────────────────────────────────────────────────────
+# One round-trip for the whole create: the sub row plus every join table.
+# Join ids arrive as text[] arrays; DISTINCT / ON CONFLICT replace the old
+# Python-side de-duplication. The final SELECT also builds the SubDetail
+# collections from the request ids (the referenced rows already exist, so no
+# re-read of the new sub is needed; feedback is always empty on create).
+_CREATE_SUB = text("""
+    WITH new_sub AS (
+        INSERT INTO subs (project_id, intent_primary, project_need_id, result, created_by)
+        VALUES (:project_id, :intent_primary, :project_need_id, :result, :created_by)
+        RETURNING id, created_at, updated_at
+    ),
+    c AS (
+        INSERT INTO sub_to_client (sub_id, creative_id)
+        SELECT DISTINCT new_sub.id, x FROM new_sub, unnest(CAST(:client_ids AS text[])) AS x
+        ON CONFLICT DO NOTHING
+    ),
+    t AS (
+        INSERT INTO sub_to_team (sub_id, team_id)
+        SELECT DISTINCT new_sub.id, x FROM new_sub, unnest(CAST(:originator_ids AS text[])) AS x
+        ON CONFLICT DO NOTHING
+    ),
+    r AS (
+        INSERT INTO sub_recipients (sub_id, recipient_type, recipient_id, recipient_company)
+        SELECT DISTINCT new_sub.id, x.rtype, x.rid, NULL
+          FROM new_sub,
+               unnest(CAST(:rtypes AS text[]), CAST(:rids AS text[])) AS x(rtype, rid)
+        ON CONFLICT DO NOTHING
+    ),
+    m AS (
+        INSERT INTO sub_to_mandate (sub_id, mandate_id)
+        SELECT DISTINCT new_sub.id, x FROM new_sub, unnest(CAST(:mandate_ids AS text[])) AS x
+        ON CONFLICT DO NOTHING
+    ),
+    w AS (
+        INSERT INTO sub_to_writing_sample (sub_id, writing_sample_id)
+        SELECT DISTINCT new_sub.id, x FROM new_sub, unnest(CAST(:writing_sample_ids AS text[])) AS x
+        ON CONFLICT DO NOTHING
+    )
+    SELECT
+        new_sub.id, new_sub.created_at, new_sub.updated_at,
+        (SELECT to_jsonb(p) FROM (
+            SELECT id, title, year, media_type, status, tracking_status
+              FROM projects WHERE id = :project_id
+        ) p) AS project,
+        (SELECT to_jsonb(pn) FROM (
+            SELECT id, qualifications, description
+              FROM project_needs WHERE id = :project_need_id
+        ) pn) AS project_need,
+        (SELECT jsonb_build_object('id', tm.id, 'name', tm.name)
+           FROM team tm WHERE tm.id = :created_by) AS created_by,
+        (SELECT COALESCE(jsonb_agg(jsonb_build_object('id', cr.id, 'name', cr.name)), '[]')
+           FROM creatives cr
+          WHERE cr.id = ANY(CAST(:client_ids AS text[]))) AS clients,
+        (SELECT COALESCE(jsonb_agg(jsonb_build_object('id', tm.id, 'name', tm.name)), '[]')
+           FROM team tm
+          WHERE tm.id = ANY(CAST(:originator_ids AS text[]))) AS originators,
+        (SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                    'id',   x.rid,
+                    'type', x.rtype,
+                    'name', COALESCE(e.name, ext.name, cr.name, x.rid))), '[]')
+           FROM (SELECT DISTINCT rtype, rid
+                   FROM unnest(CAST(:rtypes AS text[]), CAST(:rids AS text[])) AS u(rtype, rid)) x
+           LEFT JOIN executives e
+                  ON x.rtype = 'executive'    AND e.id   = x.rid
+           LEFT JOIN external_talent_reps ext
+                  ON x.rtype = 'external_rep' AND ext.id = x.rid
+           LEFT JOIN creatives cr
+                  ON x.rtype = 'creative'     AND cr.id  = x.rid) AS recipients,
+        (SELECT COALESCE(jsonb_agg(to_jsonb(ws)), '[]') FROM (
+            SELECT id, filename, file_type, size_bytes, uploaded_at, file_description
+              FROM writing_samples
+             WHERE id = ANY(CAST(:writing_sample_ids AS text[]))
+        ) ws) AS writing_samples,
+        (SELECT COALESCE(jsonb_agg(to_jsonb(md)), '[]') FROM (
+            SELECT id, name, description, status
+              FROM mandates
+             WHERE id = ANY(CAST(:mandate_ids AS text[]))
+        ) md) AS mandates
+    FROM new_sub
+""")
+
+
 @router.post("", response_model=schemas.SubDetail, status_code=201, dependencies=[Depends(require_writer)])
 def create_sub(body: schemas.SubCreate, db: Session = Depends(get_db)):
     """
-    1) insert into `subs`
-    2) de‑duplicate each list
-    3) bulk‑insert every join table with SQLAlchemy Core
+    Insert the sub and all of its join rows in a single CTE statement,
+    which also returns everything the SubDetail response needs.
     """
-    # ------------------------------------------------------------------ 1
-    sub_row = models.Sub(
-        project_id      = body.project_id,
-        intent_primary  = body.intent_primary,
-        project_need_id = body.project_need_id,
-        result          = body.result or "no_response",
-        # created_by      = body.created_by,
-        created_by      = "TM_00011",
-    )
-    db.add(sub_row)
-    db.flush()                    # sub_row.id populated
-    sid = sub_row.id
-
-    # ------------------------------------------------------------------ 2
-    body.client_ids         = list(dict.fromkeys(body.client_ids))
-    body.originator_ids     = list(dict.fromkeys(body.originator_ids))
-    body.writing_sample_ids = list(dict.fromkeys(body.writing_sample_ids))
-    body.mandate_ids        = list(dict.fromkeys(body.mandate_ids))
-
-    uniq_recips: list[schemas._RecipientIn] = []
-    seen_r = set()
-    for r in body.recipient_rows:
-        key = (r.recipient_type, r.recipient_id)
-        if key not in seen_r:
-            seen_r.add(key)
-            uniq_recips.append(r)
-    body.recipient_rows = uniq_recips
-
-    # ------------------------------------------------------------------ 3
-    if body.client_ids:
-        db.execute(
-            models.sub_to_client.insert().values(
-                [{"sub_id": sid, "creative_id": cid} for cid in body.client_ids]
-            )
-        )
-
-    if body.originator_ids:
-        db.execute(
-            models.sub_to_team.insert().values(
-                [{"sub_id": sid, "team_id": tid} for tid in body.originator_ids]
-            )
-        )
-
-    if body.recipient_rows:
-        db.execute(
-            models.SubRecipient.__table__.insert().values(
-                [
-                    {
-                        "sub_id":            sid,
-                        "recipient_type":    r.recipient_type,
-                        "recipient_id":      r.recipient_id,
-                        "recipient_company": None,
-                    }
-                    for r in body.recipient_rows
-                ]
-            )
-        )
-
-    if body.mandate_ids:
-        db.execute(
-            pg_insert(models.sub_to_mandate)
-            .values([{"sub_id": sid, "mandate_id": mid} for mid in body.mandate_ids])
-            .on_conflict_do_nothing()
-        )
-
-    if body.writing_sample_ids:
-        db.execute(
-            models.sub_to_writing_sample.insert().values(
-                [
-                    {"sub_id": sid, "writing_sample_id": ws}
-                    for ws in body.writing_sample_ids
-                ]
-            )
-        )
-
     try:
+        row = db.execute(_CREATE_SUB, {
+            "project_id":         body.project_id,
+            "intent_primary":     body.intent_primary,
+            "project_need_id":    body.project_need_id,
+            "result":             body.result or "no_response",
+            # "created_by":       body.created_by,
+            "created_by":         "TM_00011",
+            "client_ids":         list(body.client_ids),
+            "originator_ids":     list(body.originator_ids),
+            "rtypes":             [r.recipient_type for r in body.recipient_rows],
+            "rids":               [r.recipient_id for r in body.recipient_rows],
+            "mandate_ids":        list(body.mandate_ids),
+            "writing_sample_ids": list(body.writing_sample_ids),
+        }).mappings().one()
         db.commit()
     except IntegrityError as exc:
         db.rollback()
         raise HTTPException(400, f"Integrity error: {exc.orig}") from exc
 
-    return _get_sub(db, sid)
+    return schemas.SubDetail(
+        **row,
+        intent_primary = body.intent_primary,
+        result         = body.result or "no_response",
+    )
+
+# ────────────────────────────────────────────────────────────────
+#  Simple join tables: (sub_id, <col>) with ON CONFLICT DO NOTHING
+#  Statements are built once here; handlers bind :sid and the id(s)
+#  (:val / :vals) so any number of links is one statement.
+# ────────────────────────────────────────────────────────────────
+_JOIN_SPECS = {
+    "clients":         (models.sub_to_client,         "creative_id"),
+    "teams":           (models.sub_to_team,           "team_id"),
+    "writing_samples": (models.sub_to_writing_sample, "writing_sample_id"),
+    "mandates":        (models.sub_to_mandate,        "mandate_id"),
+}
+_JOIN_INSERT = {
+    # INSERT ... SELECT :sid, unnest(:vals): the id list is bound once as a
+    # text[], so the SQL is the same size however many ids are linked
+    kind: pg_insert(t)
+          .from_select(
+              ["sub_id", col],
+              select(
+                  bindparam("sid", type_=String),
+                  func.unnest(bindparam("vals", type_=ARRAY(String))),
+              ),
+          )
+          .on_conflict_do_nothing()
+    for kind, (t, col) in _JOIN_SPECS.items()
+}
+_JOIN_DELETE = {
+    kind: t.delete().where(t.c.sub_id == bindparam("sid"), t.c[col] == bindparam("val"))
+    for kind, (t, col) in _JOIN_SPECS.items()
+}
+_JOIN_DELETE_MANY = {
+    kind: t.delete().where(
+        t.c.sub_id == bindparam("sid"),
+        t.c[col].in_(bindparam("vals", expanding=True)),
+    )
+    for kind, (t, col) in _JOIN_SPECS.items()
+}
+
+def _add_links(db: Session, kind: str, sub_id: str, ids: List[str]) -> None:
+    if ids:
+        db.execute(_JOIN_INSERT[kind], {"sid": sub_id, "vals": list(ids)})
+    db.commit()
+
+def _remove_link(db: Session, kind: str, sub_id: str, val: str) -> None:
+    db.execute(_JOIN_DELETE[kind], {"sid": sub_id, "val": val})
+    db.commit()
+
+def _remove_links(db: Session, kind: str, sub_id: str, ids: List[str]) -> None:
+    """Bulk unlink: one `DELETE ... WHERE sub_id = :sid AND col IN (...)`."""
+    if ids:
+        db.execute(_JOIN_DELETE_MANY[kind], {"sid": sub_id, "vals": ids})
+    db.commit()
 
 # ────────────────────────────────────────────────────────────────
 #  CLIENTS  (sub_to_client)
 # ────────────────────────────────────────────────────────────────
 @router.post("/{sub_id}/clients", status_code=204, dependencies=[Depends(require_writer)])
 def add_clients(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
-    db.execute(
-        pg_insert(models.sub_to_client)
-        .values([{"sub_id": sub_id, "creative_id": cid} for cid in body.ids])
-        .on_conflict_do_nothing()
-    )
-    db.commit()
+    _add_links(db, "clients", sub_id, body.ids)
+
+@router.delete("/{sub_id}/clients", status_code=204, dependencies=[Depends(require_writer)])
+def remove_clients(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
+    _remove_links(db, "clients", sub_id, body.ids)
 
 @router.delete("/{sub_id}/clients/{creative_id}", status_code=204, dependencies=[Depends(require_writer)])
 def remove_client(sub_id: str, creative_id: str, db: Session = Depends(get_db)):
-    db.execute(
-        models.sub_to_client.delete().where(
-            models.sub_to_client.c.sub_id == sub_id,
-            models.sub_to_client.c.creative_id == creative_id,
-        )
-    )
-    db.commit()
+    _remove_link(db, "clients", sub_id, creative_id)
 
 # ------------------------------------------------------------------
 #  TEAM  (sub_to_team)
 # ------------------------------------------------------------------
 @router.post("/{sub_id}/teams", status_code=204, dependencies=[Depends(require_writer)])
 def add_teams(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
-    db.execute(
-        pg_insert(models.sub_to_team)
-        .values([{"sub_id": sub_id, "team_id": tid} for tid in body.ids])
-        .on_conflict_do_nothing()
-    )
-    db.commit()
+    _add_links(db, "teams", sub_id, body.ids)
+
+@router.delete("/{sub_id}/teams", status_code=204, dependencies=[Depends(require_writer)])
+def remove_teams(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
+    _remove_links(db, "teams", sub_id, body.ids)
 
 @router.delete("/{sub_id}/teams/{team_id}", status_code=204, dependencies=[Depends(require_writer)])
 def remove_team(sub_id: str, team_id: str, db: Session = Depends(get_db)):
-    db.execute(
-        models.sub_to_team.delete().where(
-            models.sub_to_team.c.sub_id == sub_id,
-            models.sub_to_team.c.team_id == team_id,
-        )
-    )
-    db.commit()
+    _remove_link(db, "teams", sub_id, team_id)
 
 # ────────────────────────────────────────────────────────────────
-#  WRITING SAMPLES  (sub_to_writing_sample)
+#  WRITING SAMPLES  (sub_to_writing_sample)
 # ────────────────────────────────────────────────────────────────
 @router.post("/{sub_id}/writing_samples", status_code=204, dependencies=[Depends(require_writer)])
 def add_writing_samples(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
-    db.execute(
-        pg_insert(models.sub_to_writing_sample)
-        .values([{"sub_id": sub_id, "writing_sample_id": ws} for ws in body.ids])
-        .on_conflict_do_nothing()
-    )
-    db.commit()
+    _add_links(db, "writing_samples", sub_id, body.ids)
+
+@router.delete("/{sub_id}/writing_samples", status_code=204, dependencies=[Depends(require_writer)])
+def remove_writing_samples(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
+    _remove_links(db, "writing_samples", sub_id, body.ids)
 
 @router.delete("/{sub_id}/writing_samples/{ws_id}", status_code=204, dependencies=[Depends(require_writer)])
 def remove_writing_sample(sub_id: str, ws_id: str, db: Session = Depends(get_db)):
-    db.execute(
-        models.sub_to_writing_sample.delete().where(
-            models.sub_to_writing_sample.c.sub_id == sub_id,
-            models.sub_to_writing_sample.c.writing_sample_id == ws_id,
-        )
-    )
-    db.commit()
+    _remove_link(db, "writing_samples", sub_id, ws_id)
 
 # ────────────────────────────────────────────────────────────────
 #  MANDATES  (sub_to_mandate)
 # ────────────────────────────────────────────────────────────────
 @router.post("/{sub_id}/mandates", status_code=204, dependencies=[Depends(require_writer)])
 def add_mandates(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
-    db.execute(
-        pg_insert(models.sub_to_mandate)
-        .values([{"sub_id": sub_id, "mandate_id": mid} for mid in body.ids])
-        .on_conflict_do_nothing()
-    )
-    db.commit()
+    _add_links(db, "mandates", sub_id, body.ids)
+
+@router.delete("/{sub_id}/mandates", status_code=204, dependencies=[Depends(require_writer)])
+def remove_mandates(sub_id: str, body: JoinIds, db: Session = Depends(get_db)):
+    _remove_links(db, "mandates", sub_id, body.ids)
 
 @router.delete("/{sub_id}/mandates/{mandate_id}", status_code=204, dependencies=[Depends(require_writer)])
 def remove_mandate(sub_id: str, mandate_id: str, db: Session = Depends(get_db)):
-    db.execute(
-        models.sub_to_mandate.delete().where(
-            models.sub_to_mandate.c.sub_id == sub_id,
-            models.sub_to_mandate.c.mandate_id == mandate_id,
-        )
-    )
-    db.commit()
+    _remove_link(db, "mandates", sub_id, mandate_id)
 
 # ────────────────────────────────────────────────────────────────
 #  RECIPIENTS  (sub_recipients)
 # ────────────────────────────────────────────────────────────────
-class RecipientAddBody(_RecipientIn): pass
+class RecipientAddBody(schemas.BaseModel):
+    recipient_type: schemas.SourceType
+    recipient_id:   str
+    recipient_company: Optional[str] = None
 
 @router.post("/{sub_id}/recipients", status_code=204, dependencies=[Depends(require_writer)])
 def add_recipient(sub_id: str, body: RecipientAddBody, db: Session = Depends(get_db)):
@@ -526,7 +689,7 @@ def add_recipient(sub_id: str, body: RecipientAddBody, db: Session = Depends(get
 @router.delete("/{sub_id}/recipients/{recipient_type}/{recipient_id}", status_code=204, dependencies=[Depends(require_writer)])
 def remove_recipient(
     sub_id: str,
-    recipient_type: Literal["executive", "external_rep", "creative"],
+    recipient_type: schemas.SourceType,
     recipient_id: str,
     db: Session = Depends(get_db),
 ):
@@ -540,6 +703,34 @@ def remove_recipient(
 # ────────────────────────────────────────────────────────────────
 #  FEEDBACK  (sub_feedback)
 # ────────────────────────────────────────────────────────────────
+_FEEDBACK_INSERT = text(
+    """
+    INSERT INTO sub_feedback
+        (sub_id, source_type, source_id,
+         sentiment, feedback_text, actionable_next,
+         created_by_team_id)
+    VALUES
+        (:sub_id, :source_type, :source_id,
+         :sentiment, :feedback_text, :actionable_next,
+         :team_id)
+    RETURNING id, created_at
+    """
+)
+_FEEDBACK_PATCH = text(
+    """
+    UPDATE sub_feedback
+    SET
+      sentiment       = COALESCE(:sentiment, sentiment),
+      feedback_text   = COALESCE(:feedback_text, feedback_text),
+      actionable_next = COALESCE(:actionable_next, actionable_next)
+    WHERE id = :fb_id
+    RETURNING id, sub_id, source_type, source_id,
+              sentiment, feedback_text, actionable_next, created_at
+    """
+)
+_FEEDBACK_DELETE = text("DELETE FROM sub_feedback WHERE id = :id")
+
+
 @router.post(
     "/{sub_id}/feedback",
     response_model=schemas.SubFeedbackMini,
@@ -555,19 +746,6 @@ def create_feedback(
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "sub_id mismatch")
 
     # ---------- Phase 1 – raw INSERT + RETURNING id,created_at -----
-    stmt = text(
-        """
-        INSERT INTO sub_feedback
-            (sub_id, source_type, source_id,
-             sentiment, feedback_text, actionable_next,
-             created_by_team_id)
-        VALUES
-            (:sub_id, :source_type, :source_id,
-             :sentiment, :feedback_text, :actionable_next,
-             :team_id)
-        RETURNING id, created_at
-        """
-    )
     values = dict(
         sub_id=sub_id,
         source_type=fb.source_type,
@@ -579,7 +757,7 @@ def create_feedback(
     )
 
     try:
-        row = db.execute(stmt, values).first()
+        row = db.execute(_FEEDBACK_INSERT, values).first()
     except IntegrityError as e:
         raise HTTPException(400, f"Integrity error: {e.orig}") from e
 
@@ -612,21 +790,8 @@ def patch_feedback(
     patch: schemas.SubFeedbackPatch,
     db: Session = Depends(get_db),
 ):
-    stmt = text(
-        """
-        UPDATE sub_feedback
-        SET
-          sentiment       = COALESCE(:sentiment, sentiment),
-          feedback_text   = COALESCE(:feedback_text, feedback_text),
-          actionable_next = COALESCE(:actionable_next, actionable_next)
-        WHERE id = :fb_id
-        RETURNING id, sub_id, source_type, source_id,
-                  sentiment, feedback_text, actionable_next, created_at
-        """
-    )
-
     row = db.execute(
-        stmt,
+        _FEEDBACK_PATCH,
         {
             "fb_id": fb_id,
             "sentiment": patch.sentiment,
@@ -645,7 +810,7 @@ def patch_feedback(
 @router.delete("/feedback/{fb_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_writer)])
 def delete_feedback(fb_id: str, db: Session = Depends(get_db)):
     deleted = (
-        db.execute(text("DELETE FROM sub_feedback WHERE id = :id"), {"id": fb_id})
+        db.execute(_FEEDBACK_DELETE, {"id": fb_id})
         .rowcount
     )
     if not deleted:
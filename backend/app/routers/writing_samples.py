@@ -1,25 +1,75 @@
 # backend/app/routers/writing_samples.py
 
 from fastapi import APIRouter, Depends, HTTPException, status, Body, UploadFile, File, Form
-from fastapi.responses import StreamingResponse
-from sqlalchemy import and_, text
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import RedirectResponse, StreamingResponse
+from sqlalchemy import and_, case, select, text
+from sqlalchemy.orm import Session, raiseload, selectinload
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
+from urllib.parse import quote
 from app import schemas, models
 from app.database import get_db
 from supabase import create_client
-import mimetypes, os, datetime, json, uuid
+from boto3.s3.transfer import TransferConfig
+import boto3
+import httpx
+import asyncio, logging, mimetypes, os, datetime, json, threading, time
 from ..auth_dep import require_team_or_higher, require_writer, require_admin
 
 
 
+logger = logging.getLogger(__name__)
+
 # ▶ This router is ONLY for single–writing‑sample endpoints
 router = APIRouter(prefix="/writing_samples", tags=["Writing Samples"])
 
 sb = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_ROLE_KEY"])
 WRITING_SAMPLES_BUCKET = os.getenv("WRITING_SAMPLES_BUCKET", "writing-samples")
+_SIGNED_URL_TTL = int(datetime.timedelta(hours=1).total_seconds())
+
+# Signed URLs are reused for the first half of their lifetime, so repeated
+# clicks / gallery reloads don't each cost a round-trip to Supabase.
+_SIGNED_URL_CACHE_TTL = _SIGNED_URL_TTL / 2
+_SIGNED_URL_CACHE_MAX = 10_000
+_signed_url_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_signed_url_lock = threading.Lock()
+
+# Uploads go straight to the Storage REST API so the body can be streamed
+# from the spooled upload file (storage3's upload() wants bytes or a path).
+_STORAGE_OBJECT_URL = f"{os.environ['SUPABASE_URL'].rstrip('/')}/storage/v1/object"
+_STORAGE_AUTH = {
+    "Authorization": f"Bearer {os.environ['SUPABASE_SERVICE_ROLE_KEY']}",
+    "apikey": os.environ["SUPABASE_SERVICE_ROLE_KEY"],
+}
+_UPLOAD_CHUNK = 1024 * 1024
+_storage_http = httpx.Client(timeout=httpx.Timeout(30.0, write=None))
+
+# Large files go through Storage's S3 protocol as a parallel multipart upload
+# when S3 access keys are configured (Dashboard → Storage → S3 Connection).
+SUPABASE_S3_ENDPOINT = os.getenv("SUPABASE_S3_ENDPOINT")     # https://<ref>.supabase.co/storage/v1/s3
+_MULTIPART_THRESHOLD = 50 * 1024 * 1024
+_s3 = (
+    boto3.client(
+        "s3",
+        endpoint_url          = SUPABASE_S3_ENDPOINT,
+        region_name           = os.getenv("SUPABASE_S3_REGION", "us-east-1"),
+        aws_access_key_id     = os.environ["SUPABASE_S3_ACCESS_KEY_ID"],
+        aws_secret_access_key = os.environ["SUPABASE_S3_SECRET_ACCESS_KEY"],
+    )
+    if SUPABASE_S3_ENDPOINT else None
+)
+_S3_TRANSFER = TransferConfig(
+    multipart_threshold = _MULTIPART_THRESHOLD,
+    multipart_chunksize = 16 * 1024 * 1024,
+    max_concurrency     = 8,
+    use_threads         = True,
+)
+
+# load the system mime database now rather than on a cold worker's first upload
+mimetypes.init()
+_MIME_BY_EXT: dict[str, str] = {}
 
 
 
@@ -27,34 +77,86 @@ WRITING_SAMPLES_BUCKET = os.getenv("WRITING_SAMPLES_BUCKET", "writing-samples")
 def _safe_filename(name: str) -> str:
     return name.replace("/", "_").replace("\\", "_")
 
+def _guess_content_type(filename: str) -> str:
+    """Content type from the file extension, memoized per extension."""
+    ext = os.path.splitext(filename)[1].lower()
+    ctype = _MIME_BY_EXT.get(ext)
+    if ctype is None:
+        ctype = mimetypes.types_map.get(ext) or "application/octet-stream"
+        _MIME_BY_EXT[ext] = ctype
+    return ctype
+
 def _build_storage_path(primary_creative: str, primary_project: str, filename: str) -> str:
-    # Add a short random prefix to avoid collisions:
-    rand = uuid.uuid4().hex  # 32 hex chars
-    rand = str(rand)[-5:]
+    # Add a short random suffix to avoid collisions:
+    rand = os.urandom(3).hex()  # 6 hex chars
     return f"{primary_creative}/{primary_project}/{_safe_filename(filename)}_{rand}"
 
-def _resolve_user_name(db: Session, user_id: str | None) -> str | None:
+class _StorageObjectExists(Exception):
+    """Storage refused the upload because the object path is taken."""
+
+def _upload(storage_path: str, f: BinaryIO, size: int, content_type: str) -> None:
     """
-    Translate a TM_ / CR_ ID into the person’s name.
-    Returns None for null / unknown / unsupported prefixes.
+    Blocking Supabase Storage upload that streams `f` in 1 MB chunks, so
+    memory stays flat whatever the file size. Async callers run it via
+    asyncio.to_thread. Raises _StorageObjectExists when the path is taken,
+    RuntimeError with Storage's message on any other failure.
     """
-    if not user_id:
-        return None
-
-    prefix = user_id[:2]
-    if prefix == "CR":
-        return (
-            db.query(models.Creative.name)
-              .filter(models.Creative.id == user_id)
-              .scalar()
-        )
-    if prefix == "TM":
-        return (
-            db.query(models.Manager.name)           # table name is `team`
-              .filter(models.Manager.id == user_id)
-              .scalar()
-        )
-    return None
+    f.seek(0)
+    resp = _storage_http.post(
+        f"{_STORAGE_OBJECT_URL}/{WRITING_SAMPLES_BUCKET}/{quote(storage_path)}",
+        content=iter(lambda: f.read(_UPLOAD_CHUNK), b""),
+        headers={
+            **_STORAGE_AUTH,
+            "Content-Type": content_type,
+            "Content-Length": str(size),
+            "x-upsert": "false",
+        },
+    )
+    if resp.is_error:
+        # older Storage versions answer 400 with statusCode "409" in the body
+        try:
+            err = resp.json()
+        except ValueError:
+            err = {}
+        if resp.status_code == 409 or str(err.get("statusCode")) == "409" or err.get("error") == "Duplicate":
+            raise _StorageObjectExists(storage_path)
+        raise RuntimeError(f"Storage upload failed ({resp.status_code}): {resp.text}")
+
+def _remove_object(storage_path: str) -> None:
+    """Best-effort delete of an uploaded object whose DB rows were rolled back."""
+    try:
+        sb.storage.from_(WRITING_SAMPLES_BUCKET).remove([storage_path])
+    except Exception:
+        logger.warning("could not remove orphaned upload %s", storage_path, exc_info=True)
+
+def _upload_multipart(storage_path: str, f: BinaryIO, content_type: str) -> None:
+    """Blocking S3 multipart upload: 16 MB parts, up to 8 in flight."""
+    f.seek(0)
+    _s3.upload_fileobj(
+        f,
+        WRITING_SAMPLES_BUCKET,
+        storage_path,
+        ExtraArgs={"ContentType": content_type},
+        Config=_S3_TRANSFER,
+    )
+
+# Uploader's display name from a TM_ / CR_ id, as a correlated SQL expression
+# so it rides along in the detail query (None for null / other prefixes).
+_UPLOADED_BY_NAME = case(
+    (
+        models.WritingSample.uploaded_by.startswith("CR"),
+        select(models.Creative.name)
+          .where(models.Creative.id == models.WritingSample.uploaded_by)
+          .scalar_subquery(),
+    ),
+    (
+        models.WritingSample.uploaded_by.startswith("TM"),
+        select(models.Manager.name)                  # table name is `team`
+          .where(models.Manager.id == models.WritingSample.uploaded_by)
+          .scalar_subquery(),
+    ),
+    else_=None,
+).label("uploaded_by_name")
 
 def _get_writing_sample(db: Session, sample_id: str) -> Optional[models.WritingSample]:
     return (
@@ -63,12 +165,17 @@ def _get_writing_sample(db: Session, sample_id: str) -> Optional[models.WritingS
           .first()
     )
 
-def _get_writing_sample_detail(db: Session, sample_id: str) -> models.WritingSample | None:
+def _get_writing_sample_detail(
+    db: Session, sample_id: str
+) -> tuple[models.WritingSample, str | None] | None:
+    """(sample with projects + creatives loaded, uploader name) or None."""
     return (
-        db.query(models.WritingSample)
+        db.query(models.WritingSample, _UPLOADED_BY_NAME)
           .options(
-              joinedload(models.WritingSample.projects),   # relationship via writing_sample_to_project
-              joinedload(models.WritingSample.creatives),  # relationship via writing_sample_to_creative
+              # one IN query per collection instead of a projects × creatives join
+              selectinload(models.WritingSample.projects),   # relationship via writing_sample_to_project
+              selectinload(models.WritingSample.creatives),  # relationship via writing_sample_to_creative
+              raiseload("*"),                                # anything else must be loaded explicitly
           )
           .filter(models.WritingSample.id == sample_id)
           .first()
@@ -77,16 +184,24 @@ def _get_writing_sample_detail(db: Session, sample_id: str) -> models.WritingSam
 
 
 
+def _detail_response(ws: models.WritingSample, uploaded_name: str | None) -> schemas.WritingSampleDetail:
+    # read straight off the instance rather than spreading ws.__dict__
+    # (which drags _sa_instance_state along for pydantic to discard)
+    return schemas.WritingSampleDetail.from_orm_trusted(ws).model_copy(
+        update={"uploaded_by_name": uploaded_name}
+    )
+
+
 # routers
 
 @router.get("/{sample_id}", response_model=schemas.WritingSampleDetail, dependencies=[Depends(require_team_or_higher)])
 def get_writing_sample(sample_id: str, db: Session = Depends(get_db)):
-    ws = _get_writing_sample_detail(db, sample_id)
-    if not ws:
+    row = _get_writing_sample_detail(db, sample_id)
+    if not row:
         raise HTTPException(404, "Writing sample not found")
 
-    uploaded_name = _resolve_user_name(db, ws.uploaded_by)
-    return {**ws.__dict__, "uploaded_by_name": uploaded_name}
+    ws, uploaded_name = row
+    return _detail_response(ws, uploaded_name)
 
 
 
@@ -101,19 +216,24 @@ def update_writing_sample(
     payload: schemas.WritingSampleUpdate = Body(...),
     db: Session = Depends(get_db),
 ):
-    ws = _get_writing_sample(db, sample_id)
-    if not ws:
+    # load once, with the collections the response needs
+    row = _get_writing_sample_detail(db, sample_id)
+    if not row:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Writing sample not found")
+    ws, uploaded_name = row
 
     # Apply only the fields sent
     update_data = payload.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(ws, field, value)
 
+    # no server-side defaults change on update, so the in-memory state is
+    # the response; snapshot it before commit expires the instance
+    # (uploaded_by is not a WritingSampleUpdate field, so the name holds)
+    db.flush()
+    out = _detail_response(ws, uploaded_name)
     db.commit()
-    ws = _get_writing_sample_detail(db, sample_id)
-    uploaded_name = _resolve_user_name(db, ws.uploaded_by) if ws else None
-    return {**ws.__dict__, "uploaded_by_name": uploaded_name}
+    return out
 
 
 
@@ -159,52 +279,39 @@ async def create_writing_sample(
     if not project_ids:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "At least one project is required.")
 
-    # 2) read file bytes
-    contents = await file.read()
-    if not contents:
+    # 2) size it without reading it into memory: the multipart parser
+    #    counts the bytes as it spools them; failing that, seek to the end
+    #    of the spooled temp file (the uploaders rewind before sending)
+    f = file.file
+    size = file.size
+    if size is None:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+    if not size:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Empty file upload.")
 
     # 3) determine content type
-    content_type = (
-        file.content_type
-        or mimetypes.guess_type(file.filename)[0]
-        or "application/octet-stream"
-    )
+    content_type = file.content_type or _guess_content_type(file.filename)
 
     # 4) build storage path & upload
     primary_creative = creative_ids[0]
     primary_project  = project_ids[0]
     storage_path = _build_storage_path(primary_creative, primary_project, file.filename)
 
-    try:
-        sb.storage.from_(WRITING_SAMPLES_BUCKET).upload(
-            storage_path,
-            contents,
-            {"content-type": content_type, "upsert": False},
-        )
-    except Exception as exc:
-        if "duplicate" in str(exc).lower() or "exists" in str(exc).lower():
+    # (the upload and the sync DB work below run in worker threads so the
+    #  event loop keeps serving other requests meanwhile)
+    if _s3 is not None and size > _MULTIPART_THRESHOLD:
+        # S3 PUTs overwrite rather than conflict; the random path suffix
+        # keeps paths unique
+        await asyncio.to_thread(_upload_multipart, storage_path, f, content_type)
+    else:
+        try:
+            await asyncio.to_thread(_upload, storage_path, f, size, content_type)
+        except _StorageObjectExists:
+            # only a path clash is retried (with a fresh suffix)
             storage_path = _build_storage_path(primary_creative, primary_project, file.filename)
-            sb.storage.from_(WRITING_SAMPLES_BUCKET).upload(
-                storage_path,
-                contents,
-                {"content-type": content_type, "upsert": False},
-            )
-        else:
-            raise
-
-    # ── PHASE 1: raw INSERT + RETURNING ────────────────────────────
-    insert_sql = text("""
-        INSERT INTO writing_samples
-            (storage_bucket, storage_path, filename,
-             file_description, synopsis,
-             file_type, size_bytes, uploaded_by)
-        VALUES
-            (:bucket, :path, :filename,
-             :desc, :synopsis,
-             :type, :size, :uploaded_by)
-        RETURNING id, uploaded_at
-    """)
+            await asyncio.to_thread(_upload, storage_path, f, size, content_type)
+
     params = {
         "bucket": WRITING_SAMPLES_BUCKET,
         "path": storage_path,
@@ -212,58 +319,100 @@ async def create_writing_sample(
         "desc": file_description,
         "synopsis": synopsis,
         "type": content_type,
-        "size": len(contents),
+        "size": size,
         "uploaded_by": uploader_id,          # ⬅️ store the actual current user’s ID
     }
-    result = db.execute(insert_sql, params)
-    row = result.first()
-    if not row:
-        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Could not create writing_sample")
-    ws_id, uploaded_at = row.id, row.uploaded_at
-    db.commit()
+    try:
+        return await asyncio.to_thread(
+            _insert_writing_sample, db, params, creative_ids, project_ids
+        )
+    except Exception:
+        # nothing was committed, so don't leave the file behind either
+        await asyncio.to_thread(_remove_object, storage_path)
+        raise
+
+
+_INSERT_WS_SQL = text("""
+    INSERT INTO writing_samples
+        (storage_bucket, storage_path, filename,
+         file_description, synopsis,
+         file_type, size_bytes, uploaded_by)
+    VALUES
+        (:bucket, :path, :filename,
+         :desc, :synopsis,
+         :type, :size, :uploaded_by)
+    RETURNING id, uploaded_at,
+        CASE
+          WHEN uploaded_by LIKE 'CR%' THEN (SELECT name FROM creatives WHERE id = uploaded_by)
+          WHEN uploaded_by LIKE 'TM%' THEN (SELECT name FROM team      WHERE id = uploaded_by)
+        END AS uploaded_by_name
+""")
+_INSERT_WS_CREATIVE = pg_insert(models.writing_sample_to_creative).on_conflict_do_nothing()
+_INSERT_WS_PROJECT  = pg_insert(models.writing_sample_to_project).on_conflict_do_nothing()
+
+def _insert_writing_sample(
+    db: Session, params: dict, creative_ids: List[str], project_ids: List[str]
+) -> dict:
+    """
+    DB half of create_writing_sample: row + link rows in one transaction,
+    then the response. Bad creative / project ids roll everything back (400).
+    """
+    try:
+        # ── PHASE 1: raw INSERT + RETURNING ────────────────────────────
+        row = db.execute(_INSERT_WS_SQL, params).first()
+        if not row:
+            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Could not create writing_sample")
+        ws_id, uploaded_at = row.id, row.uploaded_at
 
-    # ── PHASE 2: insert into join tables ──────────────────────────
-    for cid in creative_ids:
+        # ── PHASE 2: insert into join tables (one executemany each) ───
         db.execute(
-            models.writing_sample_to_creative.insert().values(
-                writing_sample_id = ws_id,
-                creative_id       = cid,
-                status            = "active",
-            )
+            _INSERT_WS_CREATIVE,
+            [
+                {"writing_sample_id": ws_id, "creative_id": cid, "status": "active"}
+                for cid in creative_ids
+            ],
         )
-    for pid in project_ids:
         db.execute(
-            models.writing_sample_to_project.insert().values(
-                writing_sample_id = ws_id,
-                project_id        = pid,
-                status            = "active",
-            )
+            _INSERT_WS_PROJECT,
+            [
+                {"writing_sample_id": ws_id, "project_id": pid, "status": "active"}
+                for pid in project_ids
+            ],
         )
-    db.commit()
-
-    # ── Return enriched detail or minimal fallback ────────────────
-    ws_detail = _get_writing_sample_detail(db, ws_id)
-    if ws_detail:
-        uploaded_name = _resolve_user_name(db, ws_detail.uploaded_by)
-        return {**ws_detail.__dict__, "uploaded_by_name": uploaded_name}
-
-    # minimal fallback
-    fallback = {
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Integrity error: {exc.orig}") from exc
+
+    # ── Build the response from what was just written ─────────────
+    # (no reload of the sample; only display fields are read: one IN query
+    #  each for projects and creatives)
+    P, C = models.Project, models.Creative
+    proj_by_id = {
+        r.id: r._asdict()
+        for r in db.query(P.id, P.title, P.year, P.media_type, P.status, P.tracking_status)
+                   .filter(P.id.in_(project_ids))
+    }
+    cre_by_id = {
+        r.id: r._asdict()
+        for r in db.query(C.id, C.name).filter(C.id.in_(creative_ids))
+    }
+    return {
         "id": ws_id,
-        "storage_bucket": WRITING_SAMPLES_BUCKET,
-        "storage_path": storage_path,
-        "filename": file.filename,
-        "file_description": file_description,
-        "synopsis": synopsis,
-        "file_type": content_type,
-        "size_bytes": len(contents),
-        "uploaded_by": uploader_id,          # ⬅️ reflect the real uploader here too
+        "storage_bucket": params["bucket"],
+        "storage_path": params["path"],
+        "filename": params["filename"],
+        "file_description": params["desc"],
+        "synopsis": params["synopsis"],
+        "file_type": params["type"],
+        "size_bytes": params["size"],
+        "uploaded_by": params["uploaded_by"],   # ⬅️ reflect the real uploader here too
         "uploaded_at": uploaded_at,
-        "uploaded_by_name": _resolve_user_name(db, uploader_id),
-        "projects": [],
-        "creatives": [],
+        "uploaded_by_name": row.uploaded_by_name,
+        # request order, each id once
+        "projects":  [proj_by_id[i] for i in dict.fromkeys(project_ids)  if i in proj_by_id],
+        "creatives": [cre_by_id[i]  for i in dict.fromkeys(creative_ids) if i in cre_by_id],
     }
-    return fallback
 
 
 
@@ -271,23 +420,34 @@ async def create_writing_sample(
 # ────────────────────────────────────────────────────────────────
 # LINK / UNLINK CREATIVES
 # ────────────────────────────────────────────────────────────────
-@router.post("/{sample_id}/creatives/{creative_id}", status_code=204, dependencies=[Depends(require_writer)])
-def link_creative_to_sample(sample_id: str, creative_id: str, db: Session = Depends(get_db)):
-    # make sure IDs exist (optional but nice)
-    if not db.get(models.WritingSample, sample_id) or not db.get(models.Creative, creative_id):
-        raise HTTPException(status.HTTP_404_NOT_FOUND)
+_FK_VIOLATION = "23503"     # SQLSTATE foreign_key_violation
 
+def _insert_link(db: Session, stmt) -> None:
+    """
+    One round-trip link INSERT (ON CONFLICT DO NOTHING): an existing row is
+    an idempotent no-op and an unknown id trips the FK → 404.
+    """
     try:
-        db.execute(
-            models.writing_sample_to_creative.insert().values(
-                writing_sample_id = sample_id,
-                creative_id       = creative_id,
-                status            = "active",
-            )
-        )
+        db.execute(stmt)
         db.commit()
-    except IntegrityError:
-        db.rollback()      # row already exists → idempotent 204
+    except IntegrityError as exc:
+        db.rollback()
+        if getattr(exc.orig, "pgcode", None) == _FK_VIOLATION:
+            raise HTTPException(status.HTTP_404_NOT_FOUND) from exc
+        raise
+
+@router.post("/{sample_id}/creatives/{creative_id}", status_code=204, dependencies=[Depends(require_writer)])
+def link_creative_to_sample(sample_id: str, creative_id: str, db: Session = Depends(get_db)):
+    _insert_link(
+        db,
+        pg_insert(models.writing_sample_to_creative)
+        .values(
+            writing_sample_id = sample_id,
+            creative_id       = creative_id,
+            status            = "active",
+        )
+        .on_conflict_do_nothing(),
+    )
     return
 
 @router.delete("/{sample_id}/creatives/{creative_id}", status_code=204, dependencies=[Depends(require_writer)])
@@ -310,20 +470,16 @@ def unlink_creative_from_sample(sample_id: str, creative_id: str, db: Session =
 # ────────────────────────────────────────────────────────────────
 @router.post("/{sample_id}/projects/{project_id}", status_code=204, dependencies=[Depends(require_writer)])
 def link_project_to_sample(sample_id: str, project_id: str, db: Session = Depends(get_db)):
-    if not db.get(models.WritingSample, sample_id) or not db.get(models.Project, project_id):
-        raise HTTPException(status.HTTP_404_NOT_FOUND)
-
-    try:
-        db.execute(
-            models.writing_sample_to_project.insert().values(
-                writing_sample_id = sample_id,
-                project_id        = project_id,
-                status            = "active",
-            )
+    _insert_link(
+        db,
+        pg_insert(models.writing_sample_to_project)
+        .values(
+            writing_sample_id = sample_id,
+            project_id        = project_id,
+            status            = "active",
         )
-        db.commit()
-    except IntegrityError:
-        db.rollback()
+        .on_conflict_do_nothing(),
+    )
     return
 
 @router.delete("/{sample_id}/projects/{project_id}", status_code=204, dependencies=[Depends(require_writer)])
@@ -346,8 +502,29 @@ def unlink_project_from_sample(sample_id: str, project_id: str, db: Session = De
 # ────────────────────────────────────────────────────────────────
 # Download Writing Sample
 # ────────────────────────────────────────────────────────────────
-@router.get("/{sample_id}/download", dependencies=[Depends(require_team_or_higher)])
-def get_download_url(sample_id: str, db: Session = Depends(get_db)):
+def _cached_signed_url(bucket: str, path: str) -> Optional[str]:
+    with _signed_url_lock:
+        hit = _signed_url_cache.get((bucket, path))
+    if hit and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
+def _cache_signed_urls(bucket: str, urls: dict[str, str]) -> None:
+    """Remember {storage_path: signed_url}; expired entries are swept when full."""
+    expires_at = time.monotonic() + _SIGNED_URL_CACHE_TTL
+    with _signed_url_lock:
+        if len(_signed_url_cache) + len(urls) > _SIGNED_URL_CACHE_MAX:
+            now = time.monotonic()
+            for key in [k for k, (exp, _) in _signed_url_cache.items() if exp <= now]:
+                del _signed_url_cache[key]
+            if len(_signed_url_cache) + len(urls) > _SIGNED_URL_CACHE_MAX:
+                _signed_url_cache.clear()
+        for path, url in urls.items():
+            _signed_url_cache[(bucket, path)] = (expires_at, url)
+
+
+def _signed_download_url(db: Session, sample_id: str) -> str:
     ws = _get_writing_sample(db, sample_id)
     if not ws:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Writing sample not found")
@@ -356,9 +533,77 @@ def get_download_url(sample_id: str, db: Session = Depends(get_db)):
     # url = sb.storage.from_(ws.storage_bucket).get_public_url(ws.storage_path)
 
     # …or a short‑lived signed URL (recommended)
-    expires_in = int(datetime.timedelta(hours=1).total_seconds())
-    url = sb.storage.from_(ws.storage_bucket).create_signed_url(
-        ws.storage_path, expires_in
-    )["signedURL"]
+    url = _cached_signed_url(ws.storage_bucket, ws.storage_path)
+    if url is None:
+        url = sb.storage.from_(ws.storage_bucket).create_signed_url(
+            ws.storage_path, _SIGNED_URL_TTL
+        )["signedURL"]
+        _cache_signed_urls(ws.storage_bucket, {ws.storage_path: url})
+    return url
+
+
+@router.get("/{sample_id}/download", dependencies=[Depends(require_team_or_higher)])
+def download_writing_sample(sample_id: str, db: Session = Depends(get_db)):
+    # straight to the object: works as an <a href> / <img src> target
+    return RedirectResponse(_signed_download_url(db, sample_id), status_code=307)
+
 
-    return {"url": url}
\ No newline at end of file
+@router.get("/{sample_id}/download_url", dependencies=[Depends(require_team_or_higher)])
+def get_download_url(sample_id: str, db: Session = Depends(get_db)):
+    return {"url": _signed_download_url(db, sample_id)}
+
+
+def _load_storage_paths(db: Session, ids: List[str]) -> dict[str, dict[str, str]]:
+    """{bucket: {storage_path: sample_id}} for the given ids, in one query."""
+    rows = db.execute(
+        select(
+            models.WritingSample.id,
+            models.WritingSample.storage_bucket,
+            models.WritingSample.storage_path,
+        ).where(models.WritingSample.id.in_(ids))
+    ).all()
+    by_bucket: dict[str, dict[str, str]] = {}
+    for sample_id, bucket, path in rows:
+        by_bucket.setdefault(bucket, {})[path] = sample_id
+    return by_bucket
+
+
+def _sign_paths(bucket: str, paths: dict[str, str]) -> dict[str, str]:
+    urls: dict[str, str] = {}
+    missing: list[str] = []
+    for path, sample_id in paths.items():
+        url = _cached_signed_url(bucket, path)
+        if url is None:
+            missing.append(path)
+        else:
+            urls[sample_id] = url
+    if not missing:
+        return urls
+
+    signed = {
+        item["path"]: item["signedURL"]
+        for item in sb.storage.from_(bucket).create_signed_urls(missing, _SIGNED_URL_TTL)
+        if not item.get("error") and item.get("path") in paths
+    }
+    _cache_signed_urls(bucket, signed)
+    urls.update((paths[path], url) for path, url in signed.items())
+    return urls
+
+
+@router.post("/download_urls", dependencies=[Depends(require_team_or_higher)])
+async def get_download_urls(
+    ids: List[str] = Body(..., embed=True),
+    db: Session = Depends(get_db),
+) -> dict[str, str]:
+    """
+    Signed URLs for many samples at once: {sample_id: url}.
+    One create_signed_urls call per bucket instead of one request per sample;
+    unknown ids and objects Supabase refuses to sign are left out.
+    """
+    if not ids:
+        return {}
+    by_bucket = await asyncio.to_thread(_load_storage_paths, db, list(dict.fromkeys(ids)))
+    urls: dict[str, str] = {}
+    for bucket, paths in by_bucket.items():
+        urls.update(await asyncio.to_thread(_sign_paths, bucket, paths))
+    return urls
\ No newline at end of file
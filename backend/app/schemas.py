@@ -1,13 +1,99 @@
 # backend/app/schemas.py
 
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Literal
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
+from typing import Annotated, Optional, List, Literal, Mapping, Union, get_args, get_origin
 from datetime import datetime
+from functools import cache
 from uuid import UUID
+import operator, types
+
+# ─── Read schemas filled from our own DB rows ────────────────────────────
+_MISSING = object()
+
+
+@cache
+def _nested_reads(cls: type["TrustedRead"]) -> dict[str, tuple[type["TrustedRead"], bool]]:
+    """{field: (read schema, is_list)} for fields holding nested TrustedReads."""
+    if not cls.__pydantic_complete__:
+        cls.model_rebuild()          # resolve forward refs like List["GenreTagMini"]
+    nested = {}
+    for name, field in cls.model_fields.items():
+        tp, is_list = field.annotation, False
+        if get_origin(tp) in (Union, types.UnionType):          # Optional[X]
+            tp = next((a for a in get_args(tp) if a is not type(None)), tp)
+        if get_origin(tp) in (list, List):
+            tp, is_list = get_args(tp)[0], True
+        if isinstance(tp, type) and issubclass(tp, TrustedRead):
+            nested[name] = (tp, is_list)
+    return nested
+
+
+def _row_projector(names: tuple[str, ...]):
+    """obj → {field: value} for the given fields, around one attrgetter."""
+    get_all = operator.attrgetter(*names)
+    if len(names) == 1:
+        get_all = lambda obj, _g=get_all: (_g(obj),)
+
+    def project(obj) -> dict:
+        if isinstance(obj, Mapping):
+            return {f: obj[f] for f in names if f in obj}
+        try:
+            return dict(zip(names, get_all(obj)))
+        except AttributeError:       # some fields absent: let those default
+            return {f: v for f in names if (v := getattr(obj, f, _MISSING)) is not _MISSING}
+    return project
+
+
+class TrustedRead(BaseModel):
+    """
+    Base for response schemas built from ORM objects / result rows.
+    from_orm_trusted() copies the attributes over with model_construct, so
+    pydantic-core doesn't re-validate data the database already typed.
+    Request payloads keep going through normal validation.
+
+    Values are taken as-is, not copied: a list field may be the very list
+    the ORM object holds, so treat these instances as read-only.
+    """
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        # field tuple + getter fixed once, when the schema class is created
+        cls.__trusted_project__ = _row_projector(tuple(cls.model_fields))
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        data = cls.__trusted_project__(obj)
+        for name, (sub, is_list) in _nested_reads(cls).items():
+            value = data.get(name)
+            if value is not None:
+                data[name] = ([sub.from_orm_trusted(v) for v in value] if is_list
+                              else sub.from_orm_trusted(value))
+        return cls.model_construct(**data)
+
+
+# ─── Shared enums (one alias each, so every model reuses the same validator) ─
+CompanyType    = Literal["tv_network", "studio", "production_company"]
+CompanyTypeAll = Literal["tv_network", "studio", "production_company", "creative"]
+SourceType     = Literal["executive", "external_rep", "creative"]
+
+# ─── Prefixed ids (one constrained type each, shared by every field) ─────
+def _prefixed_id(prefix: str):
+    return Annotated[str, StringConstraints(pattern=rf"^{prefix}_\w+$")]
+
+CreativeID      = _prefixed_id("CR")
+TeamID          = _prefixed_id("TM")
+ProjectID       = _prefixed_id("PR")
+MandateID       = _prefixed_id("MD")
+WritingSampleID = _prefixed_id("WS")
+
+
+# Schemas used by only a route or two set defer_build, so their validators
+# are built on first use rather than at import; the hot list rows build eagerly.
 
 # ─── Mini schemas for nested lists ───────────────────────────────────────
 
-class CreativeMini(BaseModel):
+class CreativeMini(TrustedRead):
     id: str
     name: str
 
@@ -19,7 +105,7 @@ class DuoMember(BaseModel):
     creative_name: str
     model_config = {"from_attributes": False}
 
-class ManagerMini(BaseModel):
+class ManagerMini(TrustedRead):
     id: str
     name: str
 
@@ -29,6 +115,10 @@ class ManagerUpdate(BaseModel):
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
 
+    # EmailStr pulls in email-validator when the schema is built; only the
+    # manager PATCH route needs it, so don't pay for it on a bare import
+    model_config = ConfigDict(defer_build=True)
+
 class CreativeProjectRole(BaseModel):
     creative_id: str
     creative_name: str
@@ -47,20 +137,20 @@ class ProjectRoleRow(BaseModel):
     involvement_rating: int | None = None
     interest_rating:    int | None = None
 
-class RecipientMini(BaseModel):
+class RecipientMini(TrustedRead):
     id:            str
-    type: Literal["executive", "external_rep", "creative"]
+    type: SourceType
     name:          str
     company_id:    str | None = None
     company_name:  str | None = None
 
-class SubFeedbackMini(BaseModel):
+class SubFeedbackMini(TrustedRead):
     id:             str
     sentiment:      str
     feedback_text:  str | None = None
     actionable_next: str | None = None
     created_at:     datetime
-    source_type: Literal["executive", "external_rep", "creative"]
+    source_type: SourceType
     source_id:      str
 
     model_config = {"from_attributes": True}
@@ -132,7 +222,7 @@ class CreativeRead(BaseModel):
     industry_notes: Optional[str]       = None
 
     # use initials in the UI, but we fetch full names here
-    managers: List[ManagerMini]         = []
+    managers: List[ManagerMini]         = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
@@ -147,7 +237,7 @@ class ManagerRead(BaseModel):
     supabase_uid: Optional[UUID]         = None
 
     # list of creatives the manager represents
-    clients: List[CreativeMini]         = []
+    clients: List[CreativeMini]         = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
@@ -163,8 +253,8 @@ class ProjectRead(BaseModel):
     updates:         Optional[str] = None
     description:     Optional[str] = None
     engagement:      Optional[str] = None
-    project_types:   list[str] = []
-    genres:          List["GenreTagMini"] = []
+    project_types:   list[str] = Field(default_factory=list)
+    genres:          List["GenreTagMini"] = Field(default_factory=list)
     network: Optional[str] = None
     studio:  Optional[str] = None
 
@@ -182,14 +272,14 @@ class ProjectCreate(BaseModel):
     tracking_status:  str
 
     # m‑n relations
-    genre_tag_ids:   list[str] = []
-    network_ids:     list[str] = []
-    studio_ids:      list[str] = []
-    prodco_ids:      list[str] = []
-    executive_ids:   list[str] = []
-    creative_ids:    list[str] = []      # clients when personal
-    project_types:   list[str] = []
-    needs:           list[ProjectNeedCreate] = []
+    genre_tag_ids:   list[str] = Field(default_factory=list)
+    network_ids:     list[str] = Field(default_factory=list)
+    studio_ids:      list[str] = Field(default_factory=list)
+    prodco_ids:      list[str] = Field(default_factory=list)
+    executive_ids:   list[str] = Field(default_factory=list)
+    creative_ids:    list[str] = Field(default_factory=list)      # clients when personal
+    project_types:   list[str] = Field(default_factory=list)
+    needs:           list[ProjectNeedCreate] = Field(default_factory=list)
 
     # not persisted in projects table but convenient for FE
     is_personal:     bool = False
@@ -235,15 +325,13 @@ class CreativeUpdate(BaseModel):
     has_directed_feature: Optional[bool] = None
     industry_notes:    Optional[str]   = None
 
-    model_config = {"from_attributes": True}
-
 
 class SurveyRow(BaseModel):
     question: str
     answer: Optional[str] = None
 
 
-class ProjectMini(BaseModel):
+class ProjectMini(TrustedRead):
     id:         str
     title:      str
     year:       Optional[str] = None
@@ -254,25 +342,13 @@ class ProjectMini(BaseModel):
     model_config = {"from_attributes": True}
 
 
-class ProjectWithRole(BaseModel):
-    id: str
-    title: str
-    year: Optional[int]
-    media_type: Optional[str]
-    status: Optional[str]
-    role: str
+class ProjectWithRole(ProjectMini):
+    role: str                  # “Creator”, “Writer”, “Director”, etc.
 
-    # new ratings
+    # ratings from the creative's latest survey
     involvement_rating: Optional[int] = None
     interest_rating:    Optional[int] = None
 
-    class Config:
-        orm_mode = True
-        
-
-class ProjectWithRole(ProjectMini):
-    role: str                  # “Creator”, “Writer”, “Director”, etc.
-
 
 class ProjectUpdate(BaseModel):
     title:         Optional[str] = None
@@ -295,19 +371,12 @@ class ProjectNeed(BaseModel):
     description: str | None
     status: Literal["Active", "Archived"]
 
-    class Config:
-        from_attributes = True
-
-class ProjectNeedCreate(BaseModel):
-    project_id:     str
-    qualifications: str                  # enum text
-    description:    str | None = None
-    project_types:  list[str] = []       # leave empty for the modal
+    model_config = {"from_attributes": True}
 
 class ProjectNeedCreateNested(BaseModel):
     qualifications: str
     description:    str | None = None
-    project_types:  list[str] = []
+    project_types:  list[str] = Field(default_factory=list)
 
 class ProjectNeedUpdate(BaseModel):
     status: Literal["Active", "Archived"]
@@ -326,14 +395,13 @@ class NoteRead(BaseModel):
     status: Optional[str]
     visibility: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = {"from_attributes": True}
 
 class NoteCreate(BaseModel):
     note: str
 
 
-class GenreTagMini(BaseModel):
+class GenreTagMini(TrustedRead):
     id:   str
     name: str
 
@@ -343,7 +411,7 @@ class GenreTagMini(BaseModel):
 
 # Writing Samples
 
-class WritingSampleBase(BaseModel):
+class WritingSampleBase(TrustedRead):
     id:              str
     filename:        str
     file_type:       str
@@ -351,8 +419,7 @@ class WritingSampleBase(BaseModel):
     uploaded_at:     datetime
     file_description: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class WritingSampleDetail(WritingSampleBase):
@@ -360,8 +427,10 @@ class WritingSampleDetail(WritingSampleBase):
     uploaded_by: str | None = None
     uploaded_by_name: str | None = None
     # .uploaded_at and the other base‑class fields already come through
-    projects:  list[ProjectMini]  = []
-    creatives: list[CreativeMini] = []
+    projects:  list[ProjectMini]  = Field(default_factory=list)
+    creatives: list[CreativeMini] = Field(default_factory=list)
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class WritingSampleListRow(WritingSampleBase):
@@ -383,15 +452,12 @@ class WritingSampleUpdate(BaseModel):
     file_description: Optional[str] = None
     synopsis: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
   
 
 
 
-class ProjectNeedMini(BaseModel):
+class ProjectNeedMini(TrustedRead):
     id:             str
     qualifications: str
     description:    str | None = None
@@ -400,21 +466,21 @@ class ProjectNeedMini(BaseModel):
 
 
 
-class MandateMini(BaseModel):
+class MandateMini(TrustedRead):
     id:          str
     name:        str
     description: str | None = None
     status:      str
     model_config = {"from_attributes": True}
 
-class MandateListItem(BaseModel):
+class MandateListItem(TrustedRead):
     id: str
     name: str
     description: Optional[str] = None
     status: Optional[str] = None
     updated_at: Optional[datetime] = None
     company_id: Optional[str] = None
-    company_type: Optional[Literal["tv_network", "studio", "production_company", "creative"]] = None
+    company_type: Optional[CompanyTypeAll] = None
     model_config = {"from_attributes": True}
 
 # Detail view schema for the Mandate pane
@@ -426,9 +492,9 @@ class MandateDetail(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     company_id: Optional[str] = None
-    company_type: Optional[Literal["tv_network", "studio", "production_company", "creative"]] = None
+    company_type: Optional[CompanyTypeAll] = None
     # add richer fields/relations here
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 class PagedMandates(BaseModel):
     total: int
@@ -439,16 +505,14 @@ class MandateUpdate(BaseModel):
     description: Optional[str] = None
     status:      Optional[Literal["active", "archived"]] = None
     company_id:   Optional[str] = None
-    company_type: Optional[Literal["tv_network", "studio", "production_company", "creative"]] = None
-
-    model_config = {"from_attributes": True}
+    company_type: Optional[CompanyTypeAll] = None
 
 
 class MandateCreate(BaseModel):
     name: str
     description: str | None = None
     company_id: str
-    company_type: Literal["tv_network", "studio", "production_company", "creative"]
+    company_type: CompanyTypeAll
     # FE always sets active, but backend will also enforce it
 
 
@@ -474,26 +538,22 @@ class RecipientRow(BaseModel):
     recipient_id:   str
     recipient_company: Optional[str] = None   # e.g. ST_00003
 
-    model_config = {"from_attributes": True}
-
 
 class SubCreate(BaseModel):
     """
     Payload for POST /subs   (everything required for a brand‑new Sub)
     Supabase will autogenerate the “SB_…” primary‑key once the row is inserted.
     """
-    project_id:        str                           # required FK
+    project_id:        ProjectID                     # required FK
     intent_primary:    Optional[str] = None          # ENUM text
     project_need_id:   Optional[str] = None          # FK → project_needs.id
     result:            Optional[str] = None          # ENUM text
     # created_by:        str                           # TM_… id of creator
-    client_ids:         List[str]                    # one or more CR_… ids
-    originator_ids:     List[str]                    # one or more TM_… ids
+    client_ids:         List[CreativeID]             # one or more CR_… ids
+    originator_ids:     List[TeamID]                 # one or more TM_… ids
     recipient_rows:     List[RecipientRow]           # at least one
-    mandate_ids:        List[str] = []               # 0‑n MD_… ids
-    writing_sample_ids: List[str] = []               # 0‑n WS_… ids
-
-    model_config = {"from_attributes": True}
+    mandate_ids:        List[MandateID] = Field(default_factory=list)         # 0‑n MD_… ids
+    writing_sample_ids: List[WritingSampleID] = Field(default_factory=list)   # 0‑n WS_… ids
 
 
 class SubUpdate(BaseModel):
@@ -502,22 +562,30 @@ class SubUpdate(BaseModel):
     *All* fields are optional — supply only what you want to replace.
     For list fields, pass the *full replacement list* (or omit to leave unchanged).
     """
-    project_id:        Optional[str] = None
+    project_id:        Optional[ProjectID] = None
     intent_primary:    Optional[str] = None
     project_need_id:   Optional[str] = None
     result:            Optional[str] = None
 
-    client_ids:         Optional[List[str]] = None
-    originator_ids:     Optional[List[str]] = None
+    client_ids:         Optional[List[CreativeID]] = None
+    originator_ids:     Optional[List[TeamID]] = None
     recipient_rows:     Optional[List[RecipientRow]] = None
-    mandate_ids:        Optional[List[str]] = None
-    writing_sample_ids: Optional[List[str]] = None
+    mandate_ids:        Optional[List[MandateID]] = None
+    writing_sample_ids: Optional[List[WritingSampleID]] = None
 
-    model_config = {"from_attributes": True}
+
+class SubMini(BaseModel):
+    """PATCH /subs/{id} default response: the id, new updated_at and the fields that changed."""
+    id:              str
+    updated_at:      datetime
+    project_id:      str | None = None
+    intent_primary:  str | None = None
+    project_need_id: str | None = None
+    result:          str | None = None
 
 
 
-class SubListRow(BaseModel):
+class SubListRow(TrustedRead):
     sub_id:            str
     created_at:        datetime
     updated_at:        datetime
@@ -531,8 +599,8 @@ class SubListRow(BaseModel):
     result:            str | None
     feedback_count:    int
     has_positive:      bool
-    recipients:        list[RecipientMini] = []   # ← add structured recipients
-    clients_list:      list[CreativeMini]  = []
+    recipients:        list[RecipientMini] = Field(default_factory=list)   # ← add structured recipients
+    clients_list:      list[CreativeMini]  = Field(default_factory=list)
     # (optional, for the modal label + bubble)
     feedback_id:         str | None = None
     feedback_sentiment:  str | None = None        # 'positive' | 'not positive'
@@ -552,17 +620,20 @@ class SubDetail(BaseModel):
     updated_at:     datetime
     created_by:     ManagerMini | None
 
-    clients:        list[CreativeMini] = []
-    originators:    list[ManagerMini]  = []
-    recipients:     list[RecipientMini] = []
-    writing_samples: list[WritingSampleBase] = []
-    feedback:        list[SubFeedbackMini]  = []
-    mandates:        list[MandateMini]      = []
+    clients:        list[CreativeMini] = Field(default_factory=list)
+    originators:    list[ManagerMini]  = Field(default_factory=list)
+    recipients:     list[RecipientMini] = Field(default_factory=list)
+    writing_samples: list[WritingSampleBase] = Field(default_factory=list)
+    feedback:        list[SubFeedbackMini]  = Field(default_factory=list)
+    mandates:        list[MandateMini]      = Field(default_factory=list)
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class PagedSubs(BaseModel):
-    total: int
+    total: int | None = None          # None on cursor pages
     items: List[SubListRow]
+    next_cursor: str | None = None    # pass back as ?cursor= for the next page
 
     model_config = {"from_attributes": True}
 
@@ -574,22 +645,22 @@ class PagedSubs(BaseModel):
 class CompanyMini(BaseModel):
     id:   str
     name: str
-    class Config: orm_mode = True
+    model_config = {"from_attributes": True}
 
 class TVNetwork(BaseModel):
     id: str
     name: str
-    class Config: orm_mode = True
+    model_config = {"from_attributes": True}
 
 class Studio(BaseModel):
     id: str
     name: str
-    class Config: orm_mode = True
+    model_config = {"from_attributes": True}
 
 class ProductionCompany(BaseModel):
     id: str
     name: str
-    class Config: orm_mode = True
+    model_config = {"from_attributes": True}
 
 class ExternalAgency(BaseModel):
     id: str
@@ -619,9 +690,9 @@ class ExecutiveBase(BaseModel):
     email: str | None = None
     phone: str | None = None
     
-    tv_networks: list[TVNetwork] = []
-    studios: list[Studio] = []
-    production_companies: list[ProductionCompany] = []
+    tv_networks: list[TVNetwork] = Field(default_factory=list)
+    studios: list[Studio] = Field(default_factory=list)
+    production_companies: list[ProductionCompany] = Field(default_factory=list)
 
 class ExecutiveCreate(ExecutiveBase):      # POST payload
     company_type : Literal['network', 'studio', 'prodco']
@@ -634,15 +705,15 @@ class ExecutivePatch(BaseModel):
 
 class Executive(ExecutiveBase):            # response
     id: str
-    class Config: orm_mode = True
+    model_config = {"from_attributes": True}
 
 # ─── Executives list (flattened rows) ────────────────────────────────────────
-class ExecutiveListRow(BaseModel):
+class ExecutiveListRow(TrustedRead):
     executive_id:   str
     executive_name: str
     company_id:     Optional[str] = None
     company_name:   Optional[str] = None
-    company_type:   Optional[Literal["tv_network", "studio", "production_company"]] = None
+    company_type:   Optional[CompanyType] = None
 
     model_config = {"from_attributes": True}
 
@@ -655,7 +726,7 @@ class PagedExecutives(BaseModel):
 class ExecCompanyLink(BaseModel):
     company_id: str
     company_name: str
-    company_type: Literal["tv_network", "studio", "production_company"]
+    company_type: CompanyType
     status: Literal["Active", "Archived"]
     last_modified: datetime
     title: Optional[str] = None
@@ -666,6 +737,8 @@ class ExecCompaniesResponse(BaseModel):
     current: list[ExecCompanyLink]
     past: list[ExecCompanyLink]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # pulls in both "Active" and "Archived"
 class ExecutiveAtCompanyRow(BaseModel):
@@ -681,14 +754,12 @@ class ExecutiveAtCompanyRow(BaseModel):
 
 
 # ─── Executives list (AGGREGATED: 1 row per exec) ────────────────────────────
-CompanyType = Literal["tv_network", "studio", "production_company"]
-
-class ExecutiveAggListRow(BaseModel):
+class ExecutiveAggListRow(TrustedRead):
     executive_id:   str
     executive_name: str
-    company_ids:    list[str] = []
-    company_names:  list[str] = []              # FE can join(', ')
-    company_types:  list[CompanyType] = []
+    company_ids:    list[str] = Field(default_factory=list)
+    company_names:  list[str] = Field(default_factory=list)              # FE can join(', ')
+    company_types:  list[CompanyType] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
@@ -696,13 +767,15 @@ class PagedExecutivesAgg(BaseModel):
     total: int
     items: list[ExecutiveAggListRow]
 
+    model_config = ConfigDict(defer_build=True)
+
 class CompanyProjectRow(BaseModel):
     id: str
     title: str
     year: int | str | None = None
     tracking_status: str | None = None
     engagement: str | None = None
-    project_types: list[str] = []
+    project_types: list[str] = Field(default_factory=list)
     sub_count: int
 
     model_config = {"from_attributes": True}
@@ -726,12 +799,16 @@ class ExecSubFeedbackRow(BaseModel):
     feedback_created_at: Optional[datetime] = None
 
     # clients (for clickable names)
-    clients: list[CreativeMini] = []
+    clients: list[CreativeMini] = Field(default_factory=list)
+
+    model_config = ConfigDict(defer_build=True)
 
 class PagedExecSubFeedback(BaseModel):
     total: int
     items: list[ExecSubFeedbackRow]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 
 # ─── External Talent Reps ─────────────────────────────────────────────────────
@@ -753,4 +830,4 @@ class ExternalRep(RepBase):
     id: str
     created_at: datetime
     updated_at: datetime
-    class Config: orm_mode = True
\ No newline at end of file
+    model_config = {"from_attributes": True}
@@ -1,41 +1,91 @@
 # backend/app/scripts/backfill_imdb_all_creatives.py
-import argparse, sys, time, traceback
+import argparse, itertools, logging, random, sys, threading, time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Iterable, Tuple
 
+import requests
+from sqlalchemy import exists, func, select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 from app import models
-
-# Use your app's Session factory. If you don't export SessionLocal,
-# fall back to using the get_db() generator.
-try:
-    from app.database import SessionLocal  # preferred
-except Exception:
-    from app.database import get_db
-    def SessionLocal():
-        gen = get_db()
-        db = next(gen)
-        # caller must db.close(); gen.close() not strictly needed
-        return db
+from app.database import SessionLocal
 
 # TODO: CHANGE THIS LINE to point at your existing one-creative sync function.
 # Expected signature: sync_creative_credits(db: Session, creative_id: str, imdb_id: str) -> None
 from app.routers.imdb_scrape import sync_creative_credits
 
-def iter_creatives(db: Session, only_with_imdb: bool, only_missing_links: bool) -> Iterable[Tuple[str, str]]:
+logger = logging.getLogger("imdb_backfill")
+
+def _creatives_query(only_with_imdb: bool, only_missing_links: bool):
     """
-    Yields (creative_id, imdb_id). Set filters via flags.
+    SELECT (creative_id, imdb_id). Set filters via flags.
     - only_with_imdb: require imdb_id IS NOT NULL
     - only_missing_links: skip creatives that already have any rows in creative_project_roles
+    Plain column tuples through Core: no Creative entities / identity map.
     """
-    q = db.query(models.Creative.id, models.Creative.imdb_id)
+    stmt = select(models.Creative.id, models.Creative.imdb_id)
     if only_with_imdb:
-        q = q.filter(models.Creative.imdb_id.isnot(None))
+        stmt = stmt.where(models.Creative.imdb_id.isnot(None))
 
     if only_missing_links:
-        subq = db.query(models.creative_project_roles.c.creative_id).distinct()
-        q = q.filter(~models.Creative.id.in_(subq))
+        # NOT EXISTS → anti-join (NOT IN over a DISTINCT would materialize the set)
+        cpr = models.creative_project_roles
+        stmt = stmt.where(~exists().where(cpr.c.creative_id == models.Creative.id))
+    return stmt
+
+def count_creatives(db: Session, only_with_imdb: bool, only_missing_links: bool) -> int:
+    stmt = _creatives_query(only_with_imdb, only_missing_links)
+    return db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+def iter_creatives(db: Session, only_with_imdb: bool, only_missing_links: bool) -> Iterable[Tuple[str, str]]:
+    """
+    Yields (creative_id, imdb_id), streamed from a server-side cursor 500
+    rows at a time. `db` must not be committed while iterating (that would
+    close the cursor), so give it a session of its own.
+    """
+    stmt = _creatives_query(only_with_imdb, only_missing_links).order_by(models.Creative.id)
+    yield from db.execute(stmt.execution_options(yield_per=500)).tuples()
+
+class _RateLimit:
+    """At most `rate` starts per second across all workers (be nice to IMDb)."""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        time.sleep(max(0.0, start - now))
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+def _retryable(e: Exception) -> bool:
+    """
+    IMDb throttling / hiccups, or a dropped / conflicting DB transaction
+    (e.g. a failed batch commit), worth another try - not bad ids or our
+    own bugs.
+    """
+    if isinstance(e, requests.HTTPError):
+        return e.response is not None and e.response.status_code in _RETRY_STATUS
+    return isinstance(e, (requests.ConnectionError, requests.Timeout, OperationalError))
 
-    return q.order_by(models.Creative.id).all()
+def _backoff(attempt: int, base: float) -> float:
+    return min(60.0, base * 2 ** attempt) + random.random()
+
+def sync_one(creative_id: str, imdb_id: str, commit_every: int = 1) -> None:
+    """One creative in its own Session (Sessions aren't thread-safe)."""
+    db = SessionLocal()
+    try:
+        sync_creative_credits(db, creative_id, imdb_id, commit_every=commit_every)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
 
 def main():
     ap = argparse.ArgumentParser(description="One-time IMDb backfill for ALL creatives.")
@@ -43,46 +93,84 @@ def main():
                     help="Process only creatives where creatives.imdb_id IS NOT NULL.")
     ap.add_argument("--only-missing-links", action="store_true",
                     help="Skip creatives that already have any project links (creative_project_roles).")
-    ap.add_argument("--sleep", type=float, default=0.4,
-                    help="Seconds to sleep between creatives (be nice to IMDb).")
+    ap.add_argument("--workers", type=int, default=4,
+                    help="Creatives synced concurrently.")
+    ap.add_argument("--rate", type=float, default=2.5,
+                    help="Max creatives started per second across all workers (be nice to IMDb).")
+    ap.add_argument("--sleep", type=float, default=None,
+                    help="Old spelling of the rate: seconds between creatives (overrides --rate).")
+    ap.add_argument("--commit-every", type=int, default=25,
+                    help="Commit every N titles of a creative's credits (and at its end).")
+    ap.add_argument("--max-retries", type=int, default=3,
+                    help="Retries per creative on IMDb 429/5xx or network errors.")
+    ap.add_argument("--backoff", type=float, default=2.0,
+                    help="Base seconds for the exponential retry backoff (plus jitter).")
     ap.add_argument("--stop-on-error", action="store_true",
                     help="Abort on first error (default: continue).")
     ap.add_argument("--limit", type=int, default=None,
                     help="Limit number of creatives to process (for smoke tests).")
+    ap.add_argument("--quiet", action="store_true",
+                    help="Only log errors and the summary lines, not every creative.")
     args = ap.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        stream=sys.stderr, format="%(message)s")
+    limiter = _RateLimit(1.0 / args.sleep if args.sleep else args.rate)
 
-    db = SessionLocal()
+    reader = SessionLocal()     # holds the streaming cursor; workers commit in their own sessions
+    pool = ThreadPoolExecutor(max_workers=args.workers)
     try:
-        rows = iter_creatives(db, only_with_imdb=args.only_with_imdb, only_missing_links=args.only_missing_links)
+        filters = dict(only_with_imdb=args.only_with_imdb, only_missing_links=args.only_missing_links)
+        total = count_creatives(reader, **filters)
+        rows = iter_creatives(reader, **filters)
         if args.limit:
-            rows = rows[:args.limit]
-        total = len(rows)
-        print(f"Backfilling IMDb for {total} creatives...", file=sys.stderr)
+            rows = itertools.islice(rows, args.limit)
+            total = min(total, args.limit)
+        logger.warning("Backfilling IMDb for %d creatives with %d workers...", total, args.workers)
 
-        for i, (creative_id, imdb_id) in enumerate(rows, 1):
-            try:
-                if not imdb_id:
-                    # Optionally: look up by name here if you support it; otherwise skip cleanly.
-                    print(f"[{i}/{total}] {creative_id}: no imdb_id; skipping", file=sys.stderr)
-                    continue
+        def task(i: int, creative_id: str, imdb_id: str):
+            logger.info("[%d/%d] %s (%s) ...", i, total, creative_id, imdb_id)
+            for attempt in itertools.count():
+                limiter.wait()
+                try:
+                    return sync_one(creative_id, imdb_id, args.commit_every)
+                except Exception as e:
+                    if attempt >= args.max_retries or not _retryable(e):
+                        raise
+                    delay = _backoff(attempt, args.backoff)
+                    logger.warning("[%d/%d] %s: %s; retrying in %.1fs", i, total, creative_id, e, delay)
+                    time.sleep(delay)
 
-                print(f"[{i}/{total}] {creative_id} ({imdb_id}) ...", file=sys.stderr)
-                sync_creative_credits(db, creative_id, imdb_id)
-                db.commit()
-            except KeyboardInterrupt:
-                print("\nInterrupted by user.", file=sys.stderr)
-                raise
-            except Exception as e:
-                db.rollback()
-                print(f"[{i}/{total}] ERROR {creative_id} ({imdb_id}): {e}", file=sys.stderr)
-                traceback.print_exc()
+        def check(done) -> None:
+            for fut in done:
+                i, creative_id, imdb_id = pending.pop(fut)
+                e = fut.exception()
+                if e is None:
+                    continue
+                logger.error("[%d/%d] ERROR %s (%s): %s", i, total, creative_id, imdb_id, e, exc_info=e)
                 if args.stop_on_error:
-                    raise
-            finally:
-                time.sleep(args.sleep)
-        print("Done.", file=sys.stderr)
+                    raise e
+
+        # keep only a couple of tasks per worker queued, so the cursor is
+        # read as fast as the workers go rather than all up front
+        pending: dict[Future, tuple[int, str, str]] = {}
+        for i, (creative_id, imdb_id) in enumerate(rows, 1):
+            if not imdb_id:
+                # Optionally: look up by name here if you support it; otherwise skip cleanly.
+                logger.info("[%d/%d] %s: no imdb_id; skipping", i, total, creative_id)
+                continue
+            if len(pending) >= 2 * args.workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                check(done)
+            pending[pool.submit(task, i, creative_id, imdb_id)] = (i, creative_id, imdb_id)
+        check(wait(pending).done)
+        logger.warning("Done.")
+    except KeyboardInterrupt:
+        logger.warning("\nInterrupted by user.")
+        raise
     finally:
-        db.close()
+        # on error / Ctrl-C drop whatever hasn't started yet
+        pool.shutdown(wait=True, cancel_futures=True)
+        reader.close()
 
 if __name__ == "__main__":
     main()
@@ -153,6 +153,7 @@ export default function RagChatPage() {
 
   const [thinkingPhase, setThinkingPhase] = useState<string | null>(null);
   const thinkingPollTimer = useRef<number | null>(null);
+  const thinkingPollGen = useRef(0);
   const lastRunSeqRef = useRef<number | null>(null);
 
   const [includeArchived, setIncludeArchived] = useState(false);
@@ -167,19 +168,25 @@ export default function RagChatPage() {
 
   const stopThinkingPoll = useCallback(() => {
     if (thinkingPollTimer.current !== null) {
-      window.clearInterval(thinkingPollTimer.current);
+      window.clearTimeout(thinkingPollTimer.current);
       thinkingPollTimer.current = null;
     }
+    // invalidates any in-flight long-poll loop
+    thinkingPollGen.current += 1;
   }, []);
 
   const startThinkingPoll = useCallback((conversationId: number) => {
     stopThinkingPoll();
     lastRunSeqRef.current = null;
+    const gen = thinkingPollGen.current;
 
-    // poll every ~5 seconds
-    thinkingPollTimer.current = window.setInterval(async () => {
+    // long-poll: the server holds the request (up to `wait` seconds)
+    // until a new run update arrives, then we immediately ask again
+    const poll = async () => {
+      thinkingPollTimer.current = null;
+      let delay = 0;
       try {
-        const params: any = {};
+        const params: any = { wait: 25 };
         if (lastRunSeqRef.current != null) {
           params.since_seq = lastRunSeqRef.current;
         }
@@ -188,6 +195,7 @@ export default function RagChatPage() {
           `/rag-chat/conversations/${conversationId}/run_updates`,
           { params },
         );
+        if (gen !== thinkingPollGen.current) return;
 
         // data: { run_id, status, updates: [...] }
         const updates = (data && data.updates) || [];
@@ -210,11 +218,19 @@ export default function RagChatPage() {
         // once run is no longer running, stop polling
         if (data && data.status && data.status !== 'running') {
           stopThinkingPoll();
+          return;
         }
       } catch (err) {
         console.error('Error polling run_updates', err);
+        delay = 5000;
+      }
+      if (gen === thinkingPollGen.current) {
+        thinkingPollTimer.current = window.setTimeout(poll, delay);
       }
-    }, 5000);
+    };
+
+    // first poll after ~5 seconds, once the new run row exists
+    thinkingPollTimer.current = window.setTimeout(poll, 5000);
   }, [stopThinkingPoll]);
 
   // Cleanup on unmount
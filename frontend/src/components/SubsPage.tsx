@@ -220,6 +220,7 @@ export default function SubsPage() {
     const params: Record<string, any> = {
       limit,
       offset,
+      with_total: 1,           // page numbers below need the total
       since_days: since,
       project: projF || undefined,
       media_type: mtF || undefined,
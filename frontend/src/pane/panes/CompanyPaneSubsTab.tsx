@@ -51,7 +51,7 @@ interface SubRow {
   updated_at:        string;
 }
 
-interface PagedSubs { total: number; items: SubRow[]; }
+interface PagedSubs { total: number | null; items: SubRow[]; }
 
 /* ───────────── shared styles ───────────── */
 const th: CSSProperties      = { padding: 8, border: '1px solid #ddd', textAlign: 'left', verticalAlign: 'bottom' };
@@ -325,7 +325,7 @@ export default function WritingSamplesTab({
                   onClick={async (e) => {
                     e.stopPropagation();
                     try {
-                      const res = await api.get<{ url: string }>(`/writing_samples/${r.id}/download`);
+                      const res = await api.get<{ url: string }>(`/writing_samples/${r.id}/download_url`);
                       window.open(res.data.url, "_blank");
                     } catch (err) {
                       console.error("Download failed", err);
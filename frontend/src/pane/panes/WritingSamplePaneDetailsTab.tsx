@@ -134,7 +134,7 @@ export default function WritingSamplePaneDetailsTab({ writingSampleId }: { writi
   const handleDownload = async () => {
     try {
       const { data: { url } } =
-        await api.get<{ url: string }>(`/writing_samples/${writingSampleId}/download`);
+        await api.get<{ url: string }>(`/writing_samples/${writingSampleId}/download_url`);
       window.open(url, '_blank', 'noopener');
     } catch (err) {
       alert('Could not get download link');
@@ -0,0 +1,11 @@
+-- supabase/migrations/20261016120000_subs_list_keyset_index.sql
+
+
+--  /subs listing: keyset pagination
+--  GET /subs orders sub_list_view by (updated_at DESC, sub_id DESC) and pages with
+--  WHERE (updated_at, sub_id) < (:cur_ts, :cur_id); sub_list_view.sub_id is subs.id.
+--  (plain CREATE INDEX: the migration runner applies each file in a transaction,
+--  where CONCURRENTLY isn't allowed)
+
+CREATE INDEX IF NOT EXISTS idx_subs_updated_id
+  ON subs (updated_at DESC, id DESC);
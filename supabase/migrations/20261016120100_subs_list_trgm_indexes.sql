@@ -0,0 +1,29 @@
+-- supabase/migrations/20261016120100_subs_list_trgm_indexes.sql
+
+
+--  Substring (ILIKE '%term%') name searches + creative → sub lookups
+--  B-tree can't serve a leading '%'; trigram GIN indexes can.
+--  GET /subs filters sub_list_rows (own trigram indexes, 20261016120600);
+--  these cover the base tables: the creatives list `q` / projects list `q`
+--  title searches, and sub_to_client by creative_id, which sub_list_rows'
+--  rename trigger uses to find a renamed creative's subs.
+--  (plain CREATE INDEX: the migration runner applies each file in a transaction,
+--  where CONCURRENTLY isn't allowed)
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+
+
+-- 1) creative name search; creative → subs
+CREATE INDEX IF NOT EXISTS idx_creatives_name_trgm
+  ON creatives USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_sub_to_client_creative
+  ON sub_to_client (creative_id, sub_id);
+
+
+
+-- 2) project title search
+CREATE INDEX IF NOT EXISTS idx_projects_title_trgm
+  ON projects USING gin (title gin_trgm_ops);
+
@@ -0,0 +1,30 @@
+-- supabase/migrations/20261016120200_sub_recipient_enriched_view.sql
+
+
+--  sub_recipients with display names resolved in SQL
+--  GET /subs/{id} loads this (models.SubRecipientEnriched) instead of
+--  looking names up per recipient type / company table from Python.
+--  recipient_type picks the person table; recipient_company's id prefix
+--  (NW_ / ST_ / PC_) picks the company table.
+
+CREATE OR REPLACE VIEW sub_recipient_enriched AS
+SELECT
+  sr.sub_id,
+  sr.recipient_type,
+  sr.recipient_id,
+  sr.recipient_company,
+  COALESCE(e.name, ext.name, cr.name) AS person_name,
+  COALESCE(nw.name, st.name, pc.name) AS company_name
+FROM sub_recipients sr
+LEFT JOIN executives e
+       ON sr.recipient_type = 'executive'    AND e.id   = sr.recipient_id
+LEFT JOIN external_talent_reps ext
+       ON sr.recipient_type = 'external_rep' AND ext.id = sr.recipient_id
+LEFT JOIN creatives cr
+       ON sr.recipient_type = 'creative'     AND cr.id  = sr.recipient_id
+LEFT JOIN tv_networks nw
+       ON nw.id = sr.recipient_company
+LEFT JOIN studios st
+       ON st.id = sr.recipient_company
+LEFT JOIN production_companies pc
+       ON pc.id = sr.recipient_company;
@@ -0,0 +1,40 @@
+-- supabase/migrations/20261016120300_companies_all_view.sql
+
+
+--  companies_all: every company id → name as one relation
+--  Company ids carry their table in the prefix (NW_ / ST_ / PC_); this lets a
+--  single `co.id = …` join resolve any of them instead of one join per table.
+--  A plain view: Postgres pushes the id predicate into each UNION ALL branch,
+--  so a lookup is one primary-key probe per company table, and there is
+--  nothing to refresh or keep in sync on company writes.
+
+
+
+-- 1) the view
+CREATE OR REPLACE VIEW companies_all AS
+  SELECT id, name, 'NW'::text AS kind FROM tv_networks
+  UNION ALL
+  SELECT id, name, 'ST'::text AS kind FROM studios
+  UNION ALL
+  SELECT id, name, 'PC'::text AS kind FROM production_companies;
+
+
+
+-- 2) sub_recipient_enriched: one company join instead of three
+CREATE OR REPLACE VIEW sub_recipient_enriched AS
+SELECT
+  sr.sub_id,
+  sr.recipient_type,
+  sr.recipient_id,
+  sr.recipient_company,
+  COALESCE(e.name, ext.name, cr.name) AS person_name,
+  co.name                             AS company_name
+FROM sub_recipients sr
+LEFT JOIN executives e
+       ON sr.recipient_type = 'executive'    AND e.id   = sr.recipient_id
+LEFT JOIN external_talent_reps ext
+       ON sr.recipient_type = 'external_rep' AND ext.id = sr.recipient_id
+LEFT JOIN creatives cr
+       ON sr.recipient_type = 'creative'     AND cr.id  = sr.recipient_id
+LEFT JOIN companies_all co
+       ON co.id = sr.recipient_company;
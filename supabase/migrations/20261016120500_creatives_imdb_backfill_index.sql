@@ -0,0 +1,18 @@
+-- supabase/migrations/20261016120500_creatives_imdb_backfill_index.sql
+
+
+--  IMDb backfill (app/scripts/backfill_imdb_all_creatives.py --only-with-imdb)
+--  streams `SELECT id, imdb_id FROM creatives WHERE imdb_id IS NOT NULL ORDER BY id`.
+--  A partial index in id order (carrying imdb_id) turns that into an
+--  index-only scan instead of a seq scan + sort on every re-run.
+--  The --only-missing-links anti-join is already served by the
+--  creative_project_roles primary key (creative_id leads).
+--  (plain CREATE INDEX: the migration runner applies each file in a transaction,
+--  where CONCURRENTLY isn't allowed)
+
+
+
+-- 1) creatives with an IMDb id, in backfill order
+CREATE INDEX IF NOT EXISTS idx_creatives_imdb_backfill
+  ON creatives (id) INCLUDE (imdb_id)
+  WHERE imdb_id IS NOT NULL;
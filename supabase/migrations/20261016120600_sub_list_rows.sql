@@ -0,0 +1,198 @@
+-- supabase/migrations/20261016120600_sub_list_rows.sql
+
+
+--  sub_list_rows: sub_list_view stored as a table, for GET /subs
+--  sub_list_view re-aggregates clients / executives / feedback on every read;
+--  the list endpoint reads this snapshot instead, where the aggregate columns
+--  are plain (and trigram-indexable) text.
+--
+--  Maintained per sub, never refreshed in full:
+--  triggers collect the sub_ids a statement touched and re-derive just those
+--  rows from sub_list_view (DELETE + INSERT ... WHERE sub_id = ANY(...)).
+--    * sub tables: statement-level triggers over the transition tables,
+--      so a multi-row write re-derives each affected sub once
+--    * projects / people / companies: row triggers that only fire when a
+--      displayed column actually changes (an IMDb upsert that rewrites the
+--      same title doesn't reach this at all)
+--  The maintenance functions are SECURITY DEFINER, so app roles only need
+--  SELECT on sub_list_rows.
+--
+--  Note: `SELECT *` fixes the column list at creation, and the maintenance
+--  INSERT relies on it. A migration that changes sub_list_view's columns
+--  must drop and re-create this table (and its indexes) in the same step.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+
+
+-- 1) the snapshot (filled in step 5, once the triggers are in place)
+CREATE TABLE IF NOT EXISTS sub_list_rows AS
+  SELECT * FROM sub_list_view
+  WITH NO DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS sub_list_rows_sub_id_idx
+  ON sub_list_rows (sub_id);
+
+CREATE INDEX IF NOT EXISTS sub_list_rows_updated_idx
+  ON sub_list_rows (updated_at DESC, sub_id DESC);
+
+CREATE INDEX IF NOT EXISTS sub_list_rows_project_idx
+  ON sub_list_rows (project_id);
+
+CREATE INDEX IF NOT EXISTS sub_list_rows_clients_trgm
+  ON sub_list_rows USING gin (clients gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS sub_list_rows_executives_trgm
+  ON sub_list_rows USING gin (executives gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS sub_list_rows_company_trgm
+  ON sub_list_rows USING gin (recipient_company gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS sub_list_rows_project_title_trgm
+  ON sub_list_rows USING gin (project_title gin_trgm_ops);
+
+
+
+-- 2) re-derive a set of subs
+CREATE OR REPLACE FUNCTION sync_sub_list_rows(ids text[]) RETURNS void
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+BEGIN
+  IF ids IS NULL OR cardinality(ids) = 0 THEN
+    RETURN;
+  END IF;
+  -- two writers re-deriving the same sub take turns (in id order, so no
+  -- deadlock); the second one then sees the first one's committed row
+  PERFORM pg_advisory_xact_lock(hashtext('sub_list_rows'), hashtext(i))
+     FROM (SELECT DISTINCT i FROM unnest(ids) AS i ORDER BY i) AS s;
+
+  DELETE FROM sub_list_rows WHERE sub_id = ANY(ids);
+  INSERT INTO sub_list_rows
+    SELECT * FROM sub_list_view WHERE sub_id = ANY(ids);
+END;
+$$;
+
+
+
+-- 3) sub rows and everything aggregated into them (one call per statement)
+CREATE OR REPLACE FUNCTION sub_list_rows_stmt_sync() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+  key text := TG_ARGV[0];          -- column holding the sub id
+  ids text[] := '{}';
+  more text[];
+BEGIN
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    EXECUTE format('SELECT array_agg(DISTINCT %I) FROM new_rows', key) INTO more;
+    ids := ids || COALESCE(more, '{}');
+  END IF;
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    EXECUTE format('SELECT array_agg(DISTINCT %I) FROM old_rows', key) INTO more;
+    ids := ids || COALESCE(more, '{}');
+  END IF;
+  PERFORM sync_sub_list_rows(ids);
+  RETURN NULL;
+END;
+$$;
+
+-- (transition tables allow one event per trigger, hence three each)
+DO $$
+DECLARE
+  t text;
+  k text;
+BEGIN
+  FOR t, k IN
+    SELECT * FROM (VALUES
+      ('subs',           'id'),
+      ('sub_feedback',   'sub_id'),
+      ('sub_to_client',  'sub_id'),
+      ('sub_to_team',    'sub_id'),
+      ('sub_recipients', 'sub_id')
+    ) AS v(t, k)
+  LOOP
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_sub_list_rows_ins ON %I', t);
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_sub_list_rows_upd ON %I', t);
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_sub_list_rows_del ON %I', t);
+    EXECUTE format(
+      'CREATE TRIGGER trg_sub_list_rows_ins AFTER INSERT ON %I
+         REFERENCING NEW TABLE AS new_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION sub_list_rows_stmt_sync(%L)', t, k);
+    EXECUTE format(
+      'CREATE TRIGGER trg_sub_list_rows_upd AFTER UPDATE ON %I
+         REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION sub_list_rows_stmt_sync(%L)', t, k);
+    EXECUTE format(
+      'CREATE TRIGGER trg_sub_list_rows_del AFTER DELETE ON %I
+         REFERENCING OLD TABLE AS old_rows
+         FOR EACH STATEMENT EXECUTE FUNCTION sub_list_rows_stmt_sync(%L)', t, k);
+  END LOOP;
+END;
+$$;
+
+
+
+-- 4) project / name columns copied into the rows: only real changes count
+CREATE OR REPLACE FUNCTION sub_list_rows_ref_sync() RETURNS trigger
+LANGUAGE plpgsql SECURITY DEFINER SET search_path = public AS $$
+DECLARE
+  ids text[];
+BEGIN
+  CASE TG_TABLE_NAME
+    WHEN 'projects' THEN
+      SELECT array_agg(id) INTO ids FROM subs WHERE project_id = NEW.id;
+    WHEN 'creatives' THEN
+      SELECT array_agg(sub_id) INTO ids FROM (
+        SELECT sub_id FROM sub_to_client WHERE creative_id = NEW.id
+        UNION
+        SELECT sub_id FROM sub_recipients
+         WHERE recipient_type = 'creative' AND recipient_id = NEW.id
+      ) AS s;
+    WHEN 'executives' THEN
+      SELECT array_agg(DISTINCT sub_id) INTO ids FROM sub_recipients
+       WHERE recipient_type = 'executive' AND recipient_id = NEW.id;
+    WHEN 'external_talent_reps' THEN
+      SELECT array_agg(DISTINCT sub_id) INTO ids FROM sub_recipients
+       WHERE recipient_type = 'external_rep' AND recipient_id = NEW.id;
+    ELSE   -- tv_networks / studios / production_companies
+      SELECT array_agg(DISTINCT sub_id) INTO ids FROM sub_recipients
+       WHERE recipient_company = NEW.id;
+  END CASE;
+  PERFORM sync_sub_list_rows(ids);
+  RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+  t text;
+  c text;
+  w text;
+BEGIN
+  FOR t, c, w IN
+    SELECT * FROM (VALUES
+      ('projects',             'title, media_type',
+       'OLD.title IS DISTINCT FROM NEW.title OR OLD.media_type IS DISTINCT FROM NEW.media_type'),
+      ('creatives',            'name', 'OLD.name IS DISTINCT FROM NEW.name'),
+      ('executives',           'name', 'OLD.name IS DISTINCT FROM NEW.name'),
+      ('external_talent_reps', 'name', 'OLD.name IS DISTINCT FROM NEW.name'),
+      ('tv_networks',          'name', 'OLD.name IS DISTINCT FROM NEW.name'),
+      ('studios',              'name', 'OLD.name IS DISTINCT FROM NEW.name'),
+      ('production_companies', 'name', 'OLD.name IS DISTINCT FROM NEW.name')
+    ) AS v(t, c, w)
+  LOOP
+    EXECUTE format('DROP TRIGGER IF EXISTS trg_sub_list_rows_ref ON %I', t);
+    EXECUTE format(
+      'CREATE TRIGGER trg_sub_list_rows_ref
+         AFTER UPDATE OF %s ON %I
+         FOR EACH ROW WHEN (%s)
+         EXECUTE FUNCTION sub_list_rows_ref_sync()', c, t, w);
+  END LOOP;
+END;
+$$;
+
+
+
+-- 5) initial fill (CREATE TRIGGER above locks out concurrent writers until
+--    this migration commits, so nothing is missed in between)
+TRUNCATE sub_list_rows;
+INSERT INTO sub_list_rows SELECT * FROM sub_list_view;
+ANALYZE sub_list_rows;